@@ -1,5 +1,6 @@
+import hashlib
 import logging
-from typing import Dict, Optional, TypedDict, List
+from typing import Dict, Optional, TypedDict, List, Tuple
 from pydantic import BaseModel
 from amnesic.tools.vector_store import VectorStore
 import tiktoken
@@ -13,10 +14,18 @@ except Exception as e:
     logger.warning(f"Tiktoken failed to load cl100k_base: {e}. Falling back to heuristic.")
     TOKENIZER = None
 
+# Token counts per content digest; the same pages and fixtures are re-staged across turns and sessions
+TOKEN_CACHE_SIZE = 1024
+_token_cache: Dict[bytes, int] = {}
+
 def count_tokens(text: str) -> int:
-    """Accurate token counting using tiktoken (cl100k_base) with heuristic fallback."""
+    """Accurate token counting using tiktoken (cl100k_base) with heuristic fallback, memoized by content."""
     if not text or len(text.strip()) == 0:
         return 0
+    key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        return cached
     res = 0
     if TOKENIZER:
         try:
@@ -31,7 +40,11 @@ def count_tokens(text: str) -> int:
         res = int(len(text) / 3.0)
     
     # Ensure at least 1 token if text exists and is not whitespace
-    return max(res, 1)
+    res = max(res, 1)
+    if len(_token_cache) >= TOKEN_CACHE_SIZE:
+        _token_cache.pop(next(iter(_token_cache)), None)
+    _token_cache[key] = res
+    return res
 
 class DynamicPage(BaseModel):
     id: str
@@ -49,6 +62,69 @@ class PagingStats(TypedDict):
     l2_count: int
     l3_count: int
 
+class VersionedPages(dict):
+    """
+    L1 page table that bumps `version` whenever a key is added or removed,
+    including through `active_pages` by callers outside the pager.
+    In-place page edits (content, ttl) do not change the version.
+    Also keeps `usage`, the running token total of the pages it holds; the pager
+    adjusts it itself when it re-sizes a page in place.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.version = 0
+        self.usage = 0
+        if args or kwargs:
+            self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        # Rebuild copies (deepcopy snapshots, pickling) through __init__ so `usage` is recounted, not doubled
+        return (self.__class__, (dict(self),))
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self.usage -= super().__getitem__(key).tokens
+        super().__setitem__(key, value)
+        self.usage += value.tokens
+        self.version += 1
+
+    def __delitem__(self, key):
+        page = super().__getitem__(key)
+        super().__delitem__(key)
+        self.usage -= page.tokens
+        self.version += 1
+
+    def pop(self, key, *default):
+        self.version += 1
+        if key in self:
+            page = super().pop(key)
+            self.usage -= page.tokens
+            return page
+        return super().pop(key, *default)
+
+    def popitem(self):
+        self.version += 1
+        key, page = super().popitem()
+        self.usage -= page.tokens
+        return key, page
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        else:
+            self.version += 1
+        return super().__getitem__(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+        self.version += 1
+
+    def clear(self):
+        super().clear()
+        self.usage = 0
+        self.version += 1
+
 class DynamicPager:
     def __init__(self, capacity_tokens: int = 32768, vector_store: Optional[VectorStore] = None):
         """
@@ -60,10 +136,14 @@ class DynamicPager:
         self.capacity = capacity_tokens
         self.vector_store = vector_store
         
-        self.l1_active: Dict[str, DynamicPage] = {}
+        self.l1_active: VersionedPages = VersionedPages()
         self.l2_staging: Dict[str, DynamicPage] = {} 
         
         self.current_turn = 0
+        
+        # Cached bare names of the L1 file pages, rebuilt when l1_active.version moves
+        self._file_pages: Tuple[str, ...] = ()
+        self._file_pages_version = -1
 
     def tick(self):
         """
@@ -91,9 +171,11 @@ class DynamicPager:
                 key=lambda x: (x.priority, x.last_accessed)
             )
             
-            while self.current_usage > self.capacity and candidates:
-                target = candidates.pop(0)
+            for target in candidates:
+                if current_usage <= self.capacity:
+                    break
                 self.evict_to_l2(target.id)
+                current_usage -= target.tokens
                 print(f"         Kernel: Shifted {target.id} to L2.")
 
     def pin_page(self, page_id: str, content: str):
@@ -132,7 +214,9 @@ class DynamicPager:
             # REFRESH CONTENT if provided (Crucial for edit_file/write_file synchronization)
             if content:
                 page.content = content
-                page.tokens = count_tokens(content)
+                tokens = count_tokens(content)
+                self.l1_active.usage += tokens - page.tokens
+                page.tokens = tokens
             return True
 
         # 2. L2 Hit (Promote)
@@ -278,36 +362,49 @@ class DynamicPager:
         if required_tokens > self.capacity:
             return False
 
-        while self.current_usage + required_tokens > self.capacity:
-            candidates = [p for p in self.l1_active.values() if not p.pinned]
-            
-            if not candidates:
-                return False 
-            
-            # Calculate Scores
-            # Higher score = Keep. Lower score = Evict.
-            # We want to keep recent items (High last_accessed)
-            # We want to keep high priority items.
-            
-            # Normalize recency to avoid huge numbers if turns get high?
-            # Simple addition is fine for now.
-            
-            # Heuristic: 1 Priority point is worth 5 turns of recency.
-            scored_candidates = []
-            for p in candidates:
-                score = (p.priority * 10) + (p.last_accessed)
-                scored_candidates.append((score, p))
-            
-            # Find victim (lowest score)
-            victim = min(scored_candidates, key=lambda x: x[0])[1]
-            
+        usage = self.current_usage
+        if usage + required_tokens <= self.capacity:
+            return True
+
+        # Calculate Scores
+        # Higher score = Keep. Lower score = Evict.
+        # We want to keep recent items (High last_accessed)
+        # We want to keep high priority items.
+        
+        # Normalize recency to avoid huge numbers if turns get high?
+        # Simple addition is fine for now.
+        
+        # Heuristic: 1 Priority point is worth 10 turns of recency.
+        # Evicting never changes the survivors' scores, so candidates are ranked once
+        # (stable sort: ties go in load order, as min() picked them) and usage is tracked locally.
+        victims = sorted(
+            (p for p in self.l1_active.values() if not p.pinned),
+            key=lambda p: (p.priority * 10) + p.last_accessed
+        )
+        for victim in victims:
+            if usage + required_tokens <= self.capacity:
+                break
             self.evict_to_l2(victim.id)
+            usage -= victim.tokens
             
-        return True
+        return usage + required_tokens <= self.capacity
 
     @property
     def current_usage(self) -> int:
-        return sum(p.tokens for p in self.l1_active.values())
+        return self.l1_active.usage
+
+    @property
+    def version(self) -> int:
+        """Changes whenever the set of L1 pages changes; lets callers cache views of it."""
+        return self.l1_active.version
+
+    @property
+    def file_pages(self) -> Tuple[str, ...]:
+        """Names of the non-system L1 pages with the 'FILE:' prefix stripped, in load order."""
+        if self._file_pages_version != self.l1_active.version:
+            self._file_pages = tuple(k[5:] if k.startswith("FILE:") else k for k in self.l1_active if not k.startswith("SYS:"))
+            self._file_pages_version = self.l1_active.version
+        return self._file_pages
 
     @property
     def active_pages(self) -> Dict[str, DynamicPage]:
@@ -22,7 +22,7 @@ class GraphEngine:
         
         def router(state):
             if state['last_audit']['auditor_verdict'] == "HALT": return END
-            if state['last_audit']['auditor_verdict'] == "PASS" and state['manager_decision'].tool_call == "halt_and_ask": return END
+            if state['last_audit']['auditor_verdict'] == "PASS" and state['manager_decision'].is_halt: return END
             return "executor"
             
         workflow.add_conditional_edges("auditor", router, {"executor": "executor", END: END})
@@ -46,11 +46,11 @@ class GraphEngine:
                     if "SYS:" in k: continue
                     if "FILE:ARTIFACT:" in k: continue
                     
-                    clean_k = k.replace("FILE:", "")
+                    clean_k = k[5:] if k[:5] == "FILE:" else k
                     if clean_k not in valid_paths:
                         del self.session.pager.active_pages[k]
 
-                active_pages = [p.replace("FILE:", "") for p in self.session.pager.active_pages.keys() if "SYS:" not in p]
+                active_pages = self.session.pager.file_pages
                 l1_status = f"L1 RAM CONTENT: {', '.join(active_pages) if active_pages else 'EMPTY'}"
                 
                 # --- Context Visualization ---
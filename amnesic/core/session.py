@@ -1,4 +1,5 @@
 import os
+import json
 import logging
 import copy
 import re
@@ -8,6 +9,7 @@ from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
 from amnesic.drivers.factory import get_driver
+from amnesic.drivers.base import LLMDriver
 from amnesic.core.environment import ExecutionEnvironment
 from amnesic.core.dynamic_pager import DynamicPager
 from amnesic.core.comparator import Comparator
@@ -23,6 +25,16 @@ from amnesic.core.audit_policies import AuditProfile, STRICT_AUDIT, PROFILE_MAP
 from amnesic.presets.code_agent import FrameworkState, Artifact
 from amnesic.core.memory import compress_history
 
+def _select_json(text: str, key_path: str) -> str:
+    """Returns '"key.path": value' for a dotted key path into a JSON document, or "" if it doesn't resolve."""
+    try:
+        node = json.loads(text)
+        for key in key_path.split("."):
+            node = node[int(key)] if isinstance(node, list) else node[key]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return ""
+    return f'"{key_path}": {json.dumps(node)}'
+
 class AmnesicSession:
     def __init__(self, 
                  mission: str = "TASK: Default Mission.", 
@@ -46,7 +58,8 @@ class AmnesicSession:
                  recursion_limit: int = 25,
                  max_total_context: int = 32768,
                  context_mode: Literal["diligent", "creative", "balanced"] = "balanced",
-                 context_floors: Optional[Dict[str, int]] = None):
+                 context_floors: Optional[Dict[str, int]] = None,
+                 driver: Optional[LLMDriver] = None):
         
         # 1. Resolve Context Floors (Minimum Guarantees)
         # We care about FLOORS (Invariants), not CEILINGS (Intelligence).
@@ -117,7 +130,8 @@ class AmnesicSession:
             # Default temperature for non-deterministic sessions
             driver_kwargs["temperature"] = 0.1
         
-        self.driver = get_driver(provider, self.model, api_key=api_key, base_url=self.base_url, **driver_kwargs)
+        # A caller-supplied driver (e.g. shared between sequential agents) skips client construction
+        self.driver = driver or get_driver(provider, self.model, api_key=api_key, base_url=self.base_url, **driver_kwargs)
         
         self.env = ExecutionEnvironment(root_dirs=self.root_dirs)
         # Use the calculated Effective L1 Capacity
@@ -368,6 +382,8 @@ class AmnesicSession:
         return target
 
     def visualize(self):
+        # Headless runs (CI, benchmarks) skip the graph layout and ASCII render entirely
+        if os.getenv("AMNESIC_NO_VIZ"): return
         try:
             print("\n[Amnesic Kernel Architecture]")
             print(self.app.get_graph().draw_ascii())
@@ -617,7 +633,7 @@ class AmnesicSession:
                             print(f"         Kernel: Auto-Saved {part_id} before context swap.")
 
                 # CONTEXTUAL GREPPING SUPPORT
-                # Syntax: path/to/file.py?query=symbol_name
+                # Syntax: path/to/file.py?query=symbol_name (or config.json?query=key.subkey)
                 query = None
                 if "?" in file_path and "query=" in file_path:
                     file_path, query_part = file_path.split("?", 1)
@@ -634,7 +650,10 @@ class AmnesicSession:
                 
                 if content is not None:
                     # Apply contextual filter if query provided
-                    if query:
+                    if query and safe_target.endswith(".json"):
+                        # JSON: the query is a dotted key path; only the selected value enters L1
+                        found_content = _select_json(content, query)
+                    elif query:
                         # Use StructuralMapper to find the symbol
                         fmap = self.env.mappers[0]._parse_file(safe_target, file_path)
                         found_content = ""
@@ -654,7 +673,8 @@ class AmnesicSession:
                                     lines = content.split('\n')
                                     found_content = '\n'.join(lines[func['line_start']-1 : func['line_end']])
                                     break
-                        
+
+                    if query:
                         if found_content:
                             content = found_content
                             l1_key = f"{l1_key}[{query}]"
@@ -9,8 +9,16 @@ from typing import Dict, Any, Optional, List, Tuple
 from ..tools.ast_mapper import StructuralMapper
 from ..tools.vector_store import VectorStore
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("amnesic.sidecar")
 
+# Semantic query results kept between writes; agents re-issue the same query_sidecar lookups on retries
+QUERY_CACHE_SIZE = 64
+
 class SharedSidecar:
     """
     A persistent, thread-safe shared brain for the Amnesic Protocol.
@@ -18,6 +26,8 @@ class SharedSidecar:
     """
     _instance = None
     _lock = threading.Lock()
+    # Signalled on every ingest, so a consumer agent can start as soon as a producer's facts land
+    _ingested = threading.Condition(_lock)
 
     def __new__(cls, driver=None, cache_dir: str = ".amnesic_cache"):
         if cls._instance is None:
@@ -27,6 +37,7 @@ class SharedSidecar:
                     cls._instance.cache_dir = cache_dir
                     cls._instance.cache_file = os.path.join(cache_dir, "brain.json")
                     cls._instance.knowledge_graph = {}
+                    cls._instance._query_cache = {}
                     cls._instance.vector_store = VectorStore(driver=driver)
                     cls._instance._load_from_disk()
         return cls._instance
@@ -36,6 +47,7 @@ class SharedSidecar:
         Add a fact to the shared brain and index it both semantically and structurally.
         """
         with self._lock:
+            self._query_cache.clear()
             # 1. Store raw content
             self.knowledge_graph[key] = {
                 "value": value,
@@ -58,12 +70,24 @@ class SharedSidecar:
                 except Exception: pass
 
             self._save_to_disk()
+            self._ingested.notify_all()
+
+    def wait_for(self, keys: List[str], timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until every key is in the shared brain (or the timeout passes).
+        Returns True if all keys are present.
+        """
+        with self._ingested:
+            return self._ingested.wait_for(lambda: all(k in self.knowledge_graph for k in keys), timeout)
 
     def query_semantic(self, query: str, top_k: int = 3) -> List[Dict]:
         """
         Search offloaded context using fuzzy conceptual queries.
         """
         with self._lock:
+            cached = self._query_cache.get((query, top_k))
+            if cached is not None:
+                return list(cached)
             results = self.vector_store.search(query, top_k=top_k)
             output = []
             for doc_id, score in results:
@@ -74,7 +98,10 @@ class SharedSidecar:
                         "content": fact["value"],
                         "score": round(score, 3)
                     })
-            return output
+            if len(self._query_cache) >= QUERY_CACHE_SIZE:
+                self._query_cache.pop(next(iter(self._query_cache)))
+            self._query_cache[(query, top_k)] = output
+            return list(output)
 
     def query_knowledge(self, key: str) -> Optional[Any]:
         """Direct lookup by exact symbolic key."""
@@ -86,6 +113,7 @@ class SharedSidecar:
         with self._lock:
             if key in self.knowledge_graph:
                 del self.knowledge_graph[key]
+                self._query_cache.clear()
                 self._save_to_disk()
 
     def get_all_knowledge(self) -> Dict[str, Any]:
@@ -97,16 +125,22 @@ class SharedSidecar:
         try:
             if not os.path.exists(self.cache_dir):
                 os.makedirs(self.cache_dir)
-            with open(self.cache_file, "w") as f:
-                json.dump(self.knowledge_graph, f, indent=2)
+            # Rewritten on every ingest, so encode with orjson when installed (same indented layout)
+            if orjson is not None:
+                with open(self.cache_file, "wb") as f:
+                    f.write(orjson.dumps(self.knowledge_graph, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(self.cache_file, "w") as f:
+                    json.dump(self.knowledge_graph, f, indent=2)
         except Exception as e:
             logger.error(f"Failed to save brain to disk: {e}")
 
     def _load_from_disk(self):
         try:
             if os.path.exists(self.cache_file):
-                with open(self.cache_file, "r") as f:
-                    self.knowledge_graph = json.load(f)
+                with open(self.cache_file, "rb") as f:
+                    raw = f.read()
+                    self.knowledge_graph = orjson.loads(raw) if orjson is not None else json.loads(raw)
                     # Re-populate vector store for immediate use
                     for key, data in self.knowledge_graph.items():
                         self.vector_store.add_document(doc_id=key, content=data["value"], metadata=data.get("metadata"))
@@ -116,6 +150,8 @@ class SharedSidecar:
     def reset(self):
         with self._lock:
             self.knowledge_graph = {}
+            self._query_cache.clear()
             if os.path.exists(self.cache_file):
                 os.remove(self.cache_file)
-            self.vector_store = VectorStore()
+            # Keep the loaded embedding model; only the indexed documents go
+            self.vector_store.clear()
@@ -1,7 +1,8 @@
+import hashlib
 import logging
 import re
 import os
-from typing import List, Literal, TypedDict, Optional, Any
+from typing import Dict, List, Literal, TypedDict, Optional, Any, Tuple
 from pydantic import BaseModel, Field
 from fastembed import TextEmbedding
 import numpy as np
@@ -12,6 +13,9 @@ from ..core.audit_policies import AuditProfile, STRICT_AUDIT, FLUID_READ, HIGH_S
 
 logger = logging.getLogger("amnesic.auditor")
 
+# Relevance scores kept per Auditor; moves repeat heavily across turns
+RELEVANCE_CACHE_SIZE = 1024
+
 # --- 2. The Logic Engine ---
 class Auditor:
     def __init__(self, goal: str, constraints: List[str], driver: OllamaDriver, elastic_mode: bool = False, audit_profile: AuditProfile = STRICT_AUDIT, context_mode: str = "balanced"):
@@ -25,6 +29,19 @@ class Auditor:
         # Layer 1: Vector Model (Relevance)
         self.embedder = TextEmbedding(model_name="BAAI/bge-small-en-v1.5")
         self.goal_vector = list(self.embedder.embed([goal]))[0]
+        self._relevance_cache: Dict[Tuple[str, bytes], float] = {}
+
+    def _check_relevance(self, action_type: str, target: str, manager_rationale: str) -> float:
+        """Cosine relevance of a move to the goal, memoized by (action_type, digest of the move text)."""
+        action_text = f"{action_type} {target} {manager_rationale}"
+        key = (action_type, hashlib.blake2b(action_text.encode(), digest_size=16).digest())
+        relevance = self._relevance_cache.get(key)
+        if relevance is None:
+            if len(self._relevance_cache) >= RELEVANCE_CACHE_SIZE:
+                self._relevance_cache.pop(next(iter(self._relevance_cache)))
+            action_vector = list(self.embedder.embed([action_text]))[0]
+            relevance = self._relevance_cache[key] = float(np.dot(self.goal_vector, action_vector))
+        return relevance
 
     def _check_numerical_accuracy(self, claim: str, context: str) -> bool:
         """Verifies that any number mentioned in the claim exists in context."""
@@ -279,9 +296,7 @@ class Auditor:
         RELEVANCE_EXEMPT = ["stage_context", "unstage_context", "halt_and_ask", "query_sidecar", "switch_strategy", "stage_artifact"]
         
         if action_type in ["save_artifact", "edit_file", "write_file", "calculate"] and action_type not in RELEVANCE_EXEMPT:
-             action_text = f"{action_type} {target} {manager_rationale}"
-             action_vector = list(self.embedder.embed([action_text]))[0]
-             relevance = float(np.dot(self.goal_vector, action_vector))
+             relevance = self._check_relevance(action_type, target, manager_rationale)
              
              # HEURISTIC: Fast-Path for sequential log processing
              is_sequential = re.search(r"log_\d+|step_\d+", target)
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, Any, Optional, Callable, List
 from ..drivers.ollama import OllamaDriver
 from ..presets.code_agent import ManagerMove, FrameworkState
@@ -6,18 +7,31 @@ from ..core.memory import compress_history
 from ..core.policies import KernelPolicy
 from .prompt_builder import ManagerPromptBuilder
 
+def _staged_files(pager: Optional[Pager]) -> List[str]:
+    """Bare names of the non-system L1 pages (prefix checks and slicing, no substring scans)."""
+    if not pager:
+        return []
+    return [(k[5:] if k.startswith("FILE:") else k).strip() for k in pager.active_pages if not k.startswith("SYS:")]
+
 class Manager:
     def __init__(self, driver: OllamaDriver, elastic_mode: bool = False, policies: List[KernelPolicy] = []):
         self.driver = driver
         self.elastic_mode = elastic_mode
         self.policies = sorted(policies, key=lambda p: p.priority, reverse=True)
 
+    async def adecide(self, *args, **kwargs) -> ManagerMove:
+        """
+        Awaitable decide(): the blocking driver call runs in a worker thread,
+        so independent decisions can be gathered concurrently.
+        """
+        return await asyncio.to_thread(self.decide, *args, **kwargs)
+
     def decide(self, state: FrameworkState, file_map: list, pager: Optional[Pager] = None, active_context: str = "", l2_list: list = [], stream_callback: Optional[Callable] = None, history_block: str = "", forbidden_tools: List[str] = [], feedback_override: str = None) -> ManagerMove:
         """
         The Brain: Deliberates on the next step.
         """
         # --- 0. POLICY ENGINE (Deterministic Override) ---
-        user_files_staged = [f.replace("FILE:", "").strip() for f in pager.active_pages.keys() if "SYS:" not in f] if pager else []
+        user_files_staged = _staged_files(pager)
         last_feedback = feedback_override if feedback_override else (state.last_action_feedback or "")
         
         for policy in self.policies:
@@ -69,7 +83,7 @@ class Manager:
         
         # L1 OCCUPANCY WARNING
         l1_warning = ""
-        user_files_staged = [f.replace("FILE:", "").strip() for f in pager.active_pages.keys() if "SYS:" not in f] if pager else []
+        user_files_staged = _staged_files(pager)
         if user_files_staged:
             l1_warning = f"\n        [CRITICAL: L1 RAM IS OCCUPIED by {user_files_staged}]. Use 'unstage_context' before opening a DIFFERENT file."
         elif not l1_files or (len(l1_files) == 1 and "MISSION" in l1_files[0]):
@@ -144,6 +144,7 @@ class ManagerPromptBuilder:
         - To save a value: {{"tool_call": "save_artifact", "target": "ID_NAME: the actual value content"}}
         - To pin logic in L1: {{"tool_call": "save_artifact", "target": "PINNED_L1:ID_NAME: the actual value content"}}
         - To stage a specific symbol: {{"tool_call": "stage_context", "target": "path/to/file.py?query=function_name"}}
+        - To stage one JSON field: {{"tool_call": "stage_context", "target": "path/to/config.json?query=key.subkey"}}
         - To write a file: {{"tool_call": "write_file", "target": "path/to/file.ext: THE FULL FILE CONTENT HERE"}}
         - **UNSTAGE**: You MUST 'unstage_context' before opening a new file unless in ELASTIC mode.
         """
@@ -1,11 +1,17 @@
 import json
 import logging
+import functools
 from typing import List, Type, Optional, Callable
 from pydantic import BaseModel
 from .base import LLMDriver
 
 logger = logging.getLogger("amnesic.driver.anthropic")
 
+@functools.lru_cache(maxsize=None)
+def _input_schema(schema: Type[BaseModel]) -> dict:
+    """JSON schema for a tool definition; pydantic rebuilds it on every call otherwise."""
+    return schema.model_json_schema()
+
 class AnthropicDriver(LLMDriver):
     def __init__(self, api_key: str, model_name: str = "claude-3-5-sonnet-20240620", seed: Optional[int] = None):
         try:
@@ -45,7 +51,7 @@ class AnthropicDriver(LLMDriver):
         tool_definition = {
             "name": "submit_result",
             "description": f"Submit the final structured result conforming to {schema.__name__}",
-            "input_schema": schema.model_json_schema()
+            "input_schema": _input_schema(schema)
         }
 
         messages = [
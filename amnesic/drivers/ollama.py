@@ -9,8 +9,32 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.exceptions import OutputParserException
 from .base import LLMDriver
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger("amnesic.driver")
 
+# Precompiled healing patterns (hit on every structured response)
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+_FENCED_BLOCK_RE = re.compile(r'```(?:json|python|markdown|text)?\s*(.*?)\s*```', re.DOTALL)
+_TARGET_FENCE_RE = re.compile(r"```(?:[a-zA-Z]+)?\s*(.*?)\s*```", re.DOTALL)
+_BRACED_RE = re.compile(r'(\{.*\})', re.DOTALL)
+_THOUGHT_RE = re.compile(r"(?i)THOUGHT(?: PROCESS)?:\s*(.*?)(?=\n|```)", re.DOTALL)
+_THINK_TAG_RE = re.compile(r'<think>.*?</think>', re.DOTALL)
+_THOUGHT_TAG_RE = re.compile(r'\[THOUGHT\].*?\[/THOUGHT\]', re.DOTALL)
+_THOUGHT_PREFIX_RE = re.compile(r'(?i)^thought:\s*')
+
+def _loads(text: str) -> Any:
+    """Decodes JSON with orjson when installed, keeping stdlib semantics on failure."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass # e.g. NaN literals, which the stdlib accepts
+    return json.loads(text)
+
 class OllamaDriver(LLMDriver):
     def __init__(self, model_name: str = "rnj-1:8b-cloud", temperature: float = 0.1, num_ctx: int = 32768, seed: Optional[int] = None, base_url: Optional[str] = None):
         """
@@ -71,14 +95,13 @@ class OllamaDriver(LLMDriver):
         """
         # 0. Pre-cleaning: Remove Markdown Code Blocks
         # Pattern finds ```json ... ``` or just ``` ... ``` and extracts content
-        code_block_pattern = r"```(?:json)?\s*(.*?)\s*```"
-        match = re.search(code_block_pattern, content, re.DOTALL)
+        match = _FENCED_JSON_RE.search(content)
         if match:
             content = match.group(1)
 
         # 1. Try Clean Parse
         try:
-            data = json.loads(content)
+            data = _loads(content)
             return schema.model_validate(data)
         except (json.JSONDecodeError, ValueError):
             pass
@@ -91,17 +114,17 @@ class OllamaDriver(LLMDriver):
                 json_str = content[start:end]
                 # Cleanup trailing text/newlines inside the extracted block if any
                 json_str = json_str.strip()
-                data = json.loads(json_str)
+                data = _loads(json_str)
                 return schema.model_validate(data)
         except (json.JSONDecodeError, ValueError):
             pass
 
         # 3. Regex Fallback (The "Hammer")
         try:
-            match = re.search(r'(\{.*\})', content, re.DOTALL)
+            match = _BRACED_RE.search(content)
             if match:
                 json_str = match.group(1)
-                data = json.loads(json_str)
+                data = _loads(json_str)
                 return schema.model_validate(data)
         except (json.JSONDecodeError, ValueError):
             pass
@@ -117,7 +140,7 @@ class OllamaDriver(LLMDriver):
             end = repaired.rfind('}') + 1
             if start != -1 and end != 0:
                 json_str = repaired[start:end]
-                data = json.loads(json_str)
+                data = _loads(json_str)
                 return schema.model_validate(data)
         except (json.JSONDecodeError, ValueError):
             pass
@@ -194,13 +217,13 @@ class OllamaDriver(LLMDriver):
         
         # Capture thought process from text for later injection (External CoT)
         captured_thought = None
-        thought_match = re.search(r"(?i)THOUGHT(?: PROCESS)?:\s*(.*?)(?=\n|```)", text, re.DOTALL)
+        thought_match = _THOUGHT_RE.search(text)
         if thought_match:
              captured_thought = thought_match.group(1).strip()
 
         # 0. Strip Thinking Tags (CoT) first to avoid brace confusion
-        text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL)
-        text = re.sub(r'\[THOUGHT\].*?\[/THOUGHT\]', '', text, flags=re.DOTALL)
+        text = _THINK_TAG_RE.sub('', text)
+        text = _THOUGHT_TAG_RE.sub('', text)
 
         # 1. NUCLEAR PRE-HEALER: Try to isolate the JSON block
         # We find the FIRST '{' and LAST '}'
@@ -235,7 +258,7 @@ class OllamaDriver(LLMDriver):
                 return extracted
 
         # 3. Strip Markdown Code Blocks
-        code_blocks = re.findall(r'```(?:json|python|markdown|text)?\s*(.*?)\s*```', text, flags=re.DOTALL)
+        code_blocks = _FENCED_BLOCK_RE.findall(text)
         for block in reversed(code_blocks):
             # print(f"         Driver: Testing code block ({len(block)} chars)...")
             extracted = self._try_parse_schema(block.strip(), schema, default_thought=captured_thought)
@@ -342,11 +365,11 @@ class OllamaDriver(LLMDriver):
     def _try_parse_schema(self, candidate: str, schema: Type[BaseModel], default_thought: str = None) -> Optional[BaseModel]:
         """Helper to try parsing a string with a schema, including healing."""
         # 0. Pre-cleaning: remove "Thought: " or similar prefixes if they leaked into the candidate
-        candidate = re.sub(r'(?i)^thought:\s*', '', candidate.strip())
+        candidate = _THOUGHT_PREFIX_RE.sub('', candidate.strip())
         
         # Sub-attempt 1: Clean parse
         try:
-            data = json.loads(candidate)
+            data = _loads(candidate)
             # --- TYPO HEALING ---
             if schema.__name__ == "AuditorVerdict":
                 if "rationate" in data and "rationale" not in data: data["rationale"] = data.pop("rationate")
@@ -385,7 +408,7 @@ class OllamaDriver(LLMDriver):
                 t = str(data["target"])
                 if "```" in t:
                     # Strip markdown fences from target value
-                    t = re.sub(r"```(?:[a-zA-Z]+)?\s*(.*?)\s*```", r"\1", t, flags=re.DOTALL)
+                    t = _TARGET_FENCE_RE.sub(r"\1", t)
                     data["target"] = t.strip()
                 
             return schema.model_validate(data)
@@ -398,7 +421,7 @@ class OllamaDriver(LLMDriver):
         try:
             repaired = candidate.replace("'", '"')
             repaired = repaired.replace("True", "true").replace("False", "false").replace("None", "null")
-            data = json.loads(repaired)
+            data = _loads(repaired)
             # --- TYPO HEALING ---
             if schema.__name__ == "AuditorVerdict":
                 if "rationate" in data and "rationale" not in data: data["rationale"] = data.pop("rationate")
@@ -436,7 +459,7 @@ class OllamaDriver(LLMDriver):
             if schema.__name__ == "ManagerMove" and data.get("target"):
                 t = str(data["target"])
                 if "```" in t:
-                    t = re.sub(r"```(?:[a-zA-Z]+)?\s*(.*?)\s*```", r"\1", t, flags=re.DOTALL)
+                    t = _TARGET_FENCE_RE.sub(r"\1", t)
                     data["target"] = t.strip()
                 
             return schema.model_validate(data)
@@ -1,7 +1,15 @@
 import os
-from typing import List, Any, Optional
+import re
+import hashlib
+import functools
+from typing import Dict, List, Any, Optional, Set, Tuple
 from ..core.session import AmnesicSession
 
+@functools.lru_cache(maxsize=32)
+def _forbidden_pattern(terms: Tuple[str, ...]) -> "re.Pattern":
+    """One alternation over every term (longest first), so a clean artifact is scanned once."""
+    return re.compile("|".join(re.escape(t) for t in sorted(set(terms), key=len, reverse=True)))
+
 class CleanRoomSession(AmnesicSession):
     """
     A specialized session for handling Sensitive Data (PII/IP).
@@ -11,8 +19,7 @@ class CleanRoomSession(AmnesicSession):
     3. Immediate Eviction (L1 Purge)
     """
 
-    def __init__(self, mission: str, l1_capacity: int = 16384, model: Optional[str] = None, policies: List[Any] = None, **kwargs):
-        root_dir = "."
+    def __init__(self, mission: str, l1_capacity: int = 16384, model: Optional[str] = None, policies: List[Any] = None, root_dir: str = ".", **kwargs):
         super().__init__(
             mission=mission + "\n\nCRITICAL SECURITY RULE: Once the safe artifact is saved, you MUST 'unstage_context' for the original secret file. L1 RAM must be EMPTY before you 'halt_and_ask'.",
             root_dir=root_dir,
@@ -21,6 +28,8 @@ class CleanRoomSession(AmnesicSession):
             audit_profile="STRICT_AUDIT",
             **kwargs
         )
+        # Digests of artifact summaries already proven clean, per forbidden-term pattern
+        self._clean_digests: Dict[str, Set[bytes]] = {}
 
     def _setup_default_tools(self):
         super()._setup_default_tools()
@@ -34,7 +43,17 @@ class CleanRoomSession(AmnesicSession):
         Returns True if Clean.
         """
         leaks = []
+        if not forbidden_terms: return True
+        pattern = _forbidden_pattern(tuple(forbidden_terms))
+        clean = self._clean_digests.setdefault(pattern.pattern, set())
         for artifact in self.state['framework_state'].artifacts:
+            # Artifacts verified by an earlier call are skipped by content digest
+            digest = hashlib.blake2b(artifact.summary.encode(), digest_size=16).digest()
+            if digest in clean: continue
+            # Single pass for the common (clean) case; only leaking artifacts get the per-term report
+            if not pattern.search(artifact.summary):
+                clean.add(digest)
+                continue
             for term in forbidden_terms:
                 if term in artifact.summary:
                     leaks.append(f"Artifact '{artifact.identifier}' contains secret: {term}")
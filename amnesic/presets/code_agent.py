@@ -80,6 +80,11 @@ class ManagerMove(BaseModel):
         if v is None: return ""
         return str(v)
 
+    @property
+    def is_halt(self) -> bool:
+        """True when this move ends the mission (the router ENDs on an approved halt)."""
+        return self.tool_call == "halt_and_ask"
+
 # --- 4. The Auditor's Output (NEW) ---
 
 class AuditorVerdict(BaseModel):
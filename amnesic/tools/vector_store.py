@@ -1,4 +1,5 @@
 import math
+import hashlib
 import logging
 from typing import List, Dict, TypedDict, Tuple
 from fastembed import TextEmbedding
@@ -6,6 +7,9 @@ import numpy as np
 
 logger = logging.getLogger("amnesic.vector")
 
+# Embeddings kept by content digest; re-saved artifacts and reloads reuse them instead of re-embedding
+EMBEDDING_CACHE_SIZE = 1024
+
 class VectorDoc(TypedDict):
     id: str
     content: str
@@ -22,21 +26,35 @@ class VectorStore:
             "code": {},
             "text": {}
         }
+        # Content digest -> embedding, so identical text (re-saved artifacts, reloads) is embedded once
+        self._embedding_cache: Dict[bytes, List[float]] = {}
 
     def add_document(self, doc_id: str, content: str, metadata: Dict = None, collection_name: str = "text"):
         """Adds or updates a document in the specified collection."""
         if collection_name not in self.collections:
             self.collections[collection_name] = {}
             
-        # Optimization: In a real DB, we'd check hash/timestamp before re-embedding
-        embeddings = list(self.embedder.embed([content]))
-        if embeddings:
-            self.collections[collection_name][doc_id] = {
-                "id": doc_id,
-                "content": content,
-                "metadata": metadata or {},
-                "embedding": embeddings[0].tolist()
-            }
+        digest = hashlib.blake2b(content.encode(), digest_size=16).digest()
+        embedding = self._embedding_cache.get(digest)
+        if embedding is None:
+            embeddings = list(self.embedder.embed([content]))
+            if not embeddings:
+                return
+            embedding = embeddings[0].tolist()
+            if len(self._embedding_cache) >= EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.pop(next(iter(self._embedding_cache)))
+            self._embedding_cache[digest] = embedding
+        self.collections[collection_name][doc_id] = {
+            "id": doc_id,
+            "content": content,
+            "metadata": metadata or {},
+            "embedding": embedding
+        }
+
+    def clear(self):
+        """Empties every collection. The embedder and its content-addressed cache are kept."""
+        for collection in self.collections.values():
+            collection.clear()
 
     def search(self, query: str, collection_name: str = "text", top_k: int = 3) -> List[Tuple[str, float]]:
         """
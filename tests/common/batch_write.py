@@ -0,0 +1,32 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Sequence, Tuple, Union
+
+# A payload is either one buffer or a sequence of buffers written back-to-back
+Payload = Union[bytes, Sequence[bytes]]
+
+def _write_one(item: Tuple[str, Payload]) -> int:
+    path, payload = item
+    chunks = (payload,) if isinstance(payload, (bytes, bytearray, memoryview)) else tuple(payload)
+    total = sum(len(c) for c in chunks)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # One gathered write per file; finish with plain writes on a short write
+        written = os.writev(fd, chunks) if hasattr(os, "writev") and chunks else 0
+        rest = memoryview(b"".join(chunks))[written:] if written < total else b""
+        while rest:
+            rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
+    return total
+
+def batch_write(files: Iterable[Tuple[str, Payload]]) -> int:
+    """
+    Writes a scenario's fixture files concurrently and returns the total bytes written.
+    Every write has completed (or raised) by the time this returns.
+    """
+    files = list(files)
+    if len(files) < 2:
+        return sum(map(_write_one, files))
+    with ThreadPoolExecutor(max_workers=len(files)) as pool:
+        return sum(pool.map(_write_one, files))
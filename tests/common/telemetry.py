@@ -0,0 +1,80 @@
+import os
+import textwrap
+from contextlib import contextmanager
+from typing import Iterator, Sequence, Tuple
+from rich import box
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+from rich.text import Text
+
+# One Console for every proof; no repr highlighting pass over printed strings
+CONSOLE = Console(highlight=False, soft_wrap=True, markup=True)
+
+# Per-event trace output goes here; setting AMNESIC_QUIET discards it so CI runs only keep the scenario and verdict lines
+TRACE_CONSOLE = Console(quiet=True) if os.getenv("AMNESIC_QUIET") else CONSOLE
+
+# Columns of the Manager/Auditor/Executor trace shared by the semantic proofs and the control suite
+TRACE_COLS = (
+    ("Turn", "right", "cyan", 4),
+    ("L1 Files", "center", "magenta", 12),
+    ("L1 Toks", "center", "white", 10),
+    ("Arts", "center", "green", 4),
+    ("Node", "left", "blue", 10),
+    ("Manager Action", "left", "yellow", 25),
+    ("Thought Process", "left", "italic dim", 50),
+    ("Auditor", "center", None, 8),
+)
+
+# Trace labels for graph nodes; unknown nodes show their raw name
+NODE_LABELS = {"manager": "Manager 🧠", "auditor": "Auditor 🛡️", "executor": "Executor ⚡"}
+
+# Action cells are clamped to the column so Rich never has to wrap them
+ACTION_WIDTH = next(w for name, _, _, w in TRACE_COLS if name == "Manager Action")
+
+def fmt_action(move) -> str:
+    if not move: return "---"
+    action = f"{move.tool_call}({move.target})"
+    return action if len(action) <= ACTION_WIDTH else action[:ACTION_WIDTH - 1] + "…"
+
+THOUGHT_WIDTH = next(w for name, _, _, w in TRACE_COLS if name == "Thought Process")
+
+def compact_thought(text: str, width: int = THOUGHT_WIDTH) -> str:
+    """Collapses whitespace and cuts at a word boundary, so the cell is measured once and never wraps."""
+    if not text: return "---"
+    short = textwrap.shorten(text, width=width, placeholder="…")
+    # A leading word longer than the cell shortens to the bare placeholder; hard-cut it instead
+    return short if short != "…" else text[:width - 1] + "…"
+
+# The common verdicts get one shared cell each; anything else is styled on demand
+AUDIT_CELLS = {
+    "---": Text("---", style="white"),
+    "PASS": Text("PASS", style="green"),
+    "REJECT": Text("REJECT", style="red"),
+}
+
+def audit_cell(audit_val: str) -> Text:
+    cell = AUDIT_CELLS.get(audit_val)
+    if cell is None:
+        cell = Text(audit_val, style="green" if "PASS" in audit_val else "red" if "REJECT" in audit_val else "white")
+    return cell
+
+def make_trace_table(header: bool = True, cols: Sequence[Tuple[str, str, str, int]] = TRACE_COLS) -> Table:
+    """Returns a fresh, empty trace Table with the columns configured (rows separated by rules)."""
+    table = Table(show_header=header, show_lines=True, box=box.HORIZONTALS, show_edge=False, padding=(0, 1), expand=False)
+    for name, just, style, w in cols:
+        table.add_column(name if header else None, justify=just, style=style, header_style="bold " + (style or ""), width=w)
+    return table
+
+@contextmanager
+def live_trace(table: Table, console: Console = TRACE_CONSOLE) -> Iterator[Live]:
+    """
+    Redraws the trace table in place while the block runs.
+    Off a terminal (pipes, CI logs) Live leaves the cursor after the final table, so a newline is added on exit.
+    """
+    try:
+        with Live(table, console=console, refresh_per_second=8) as live:
+            yield live
+    finally:
+        if not console.is_terminal:
+            console.line()
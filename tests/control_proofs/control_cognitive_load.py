@@ -2,17 +2,34 @@ import os
 import sys
 import time
 import random
-from typing import Literal, Union
-from rich.console import Console
-from rich.table import Table
+from pathlib import Path
+from typing import Dict, Literal, Union
 from rich.panel import Panel
 from rich.text import Text
-from rich.rule import Rule
 from pydantic import BaseModel, Field
 
 # Ensure framework access for the driver
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.drivers.factory import get_driver
+from tests.common.telemetry import CONSOLE, live_trace, make_trace_table
+
+# Body of every distractor function; identical across all generated files
+NOISE_DIGITS = str(list(range(100)))
+
+# Noise files; reading any of them is the failure condition
+DISTRACTORS = frozenset(f"distractor_{k}.py" for k in range(3))
+
+# Fixtures created by run_control_proof
+CLEANUP = [Path("critical_logic.py"), *[Path(f"distractor_{k}.py") for k in range(3)]]
+
+# Telemetry Setup
+COLS = [
+    ("Turn", "right", "cyan", 4),
+    ("Context Toks", "center", "white", 12),
+    ("Action", "left", "yellow", 25),
+    ("Thought Process", "left", "italic dim", 50),
+    ("Status", "center", None, 8)
+]
 
 class ControlMove(BaseModel):
     thought: str = Field(..., description="Reasoning")
@@ -21,15 +38,33 @@ class ControlMove(BaseModel):
 
 # Standard Agent (Control) - A naive agent that tries to read everything
 class StandardReActAgent:
+    # Tool docs and JSON example; only the file listing above it changes per turn
+    STATIC_PROMPT_TAIL = (
+        "TOOLS AVAILABLE: read_file(path), edit_file(path: instruction), answer(result).\n"
+        "You prefer to have all information available before acting.\n"
+        "Output JSON with fields: 'thought', 'tool', 'arg'.\n"
+        "EXAMPLE:\n"
+        "{\n"
+        "  \"thought\": \"I need to read the file.\",\n"
+        "  \"tool\": \"read_file\",\n"
+        "  \"arg\": \"script.py\"\n"
+        "}"
+    )
+
     def __init__(self, mission: str, model: str = "rnj-1:8b-cloud", token_limit: int = 1232768):
         # We give it a HUGE context limit to simulate "Full Context Visibility" 
         # The hypothesis is that even with enough memory, the NOISE will distract it.
         self.mission = mission
+        self._prompt_head = (
+            f"MISSION: {mission}\n"
+            "You are a standard ReAct agent with a massive context window.\n"
+        )
         self.driver = get_driver("ollama", model)
         self.token_limit = token_limit
         self.history = [] 
         self.turns = 0
         self.active_context = ""
+        self._file_cache: Dict[str, str] = {} # Distractors are static during a run
 
     def step(self):
         self.turns += 1
@@ -39,20 +74,7 @@ class StandardReActAgent:
         files.sort(key=lambda x: 0 if "distractor" in x else (2 if "critical" in x else 1))
         file_list = ", ".join(files)
         
-        system_prompt = (
-            f"MISSION: {self.mission}\n"
-            "You are a standard ReAct agent with a massive context window.\n"
-            f"FILES IN DIRECTORY: {file_list}\n"
-            "TOOLS AVAILABLE: read_file(path), edit_file(path: instruction), answer(result).\n"
-            "You prefer to have all information available before acting.\n"
-            "Output JSON with fields: 'thought', 'tool', 'arg'.\n"
-            "EXAMPLE:\n"
-            "{\n"
-            "  \"thought\": \"I need to read the file.\",\n"
-            "  \"tool\": \"read_file\",\n"
-            "  \"arg\": \"script.py\"\n"
-            "}"
-        )
+        system_prompt = self._prompt_head + f"FILES IN DIRECTORY: {file_list}\n" + self.STATIC_PROMPT_TAIL
         
         # Build Prompt (Naive concatenation)
         prompt_content = system_prompt + "\n\n[CONTEXT]\n" + self.active_context
@@ -72,7 +94,7 @@ class StandardReActAgent:
         except Exception as e:
             return {
                 "turn": self.turns,
-                "action": "error", "arg": str(e), "thought": "Context Overflow / Crash", 
+                "action": "error", "arg": str(e), "arg_display": str(e)[:20] + "...", "thought": "Context Overflow / Crash", 
                 "context_len": total_tokens, "limit": self.token_limit,
                 "status": "CRASH"
             }
@@ -80,15 +102,18 @@ class StandardReActAgent:
         # Execute
         observation = ""
         arg_str = str(move.arg)
+        path = None # Resolved target path; dict args are unwrapped below
         
         if move.tool == "read_file":
             path = move.arg if isinstance(move.arg, str) else move.arg.get("path", str(move.arg))
-            if os.path.exists(path):
-                with open(path, 'r') as f: 
-                    content = f.read()
-                    self.active_context += f"\n--- FILE: {path} ---\n{content}\n"
-                    observation = f"Read {len(content)} chars from {path}."
-            else: observation = f"ERROR: File {path} not found."
+            try:
+                content = self._file_cache.get(path)
+                if content is None:
+                    content = self._file_cache[path] = Path(path).read_text()
+                self.active_context += f"\n--- FILE: {path} ---\n{content}\n"
+                observation = f"Read {len(content)} chars from {path}."
+            except FileNotFoundError:
+                observation = f"ERROR: File {path} not found."
         
         elif move.tool == "edit_file":
             if isinstance(move.arg, dict):
@@ -107,11 +132,14 @@ class StandardReActAgent:
             
         self.history.append({"role": "assistant", "content": f"Call: {move.tool}({arg_str})"})
         self.history.append({"role": "user", "content": f"Observation: {observation}"})
+        arg_display = arg_str if len(arg_str) <= 20 else arg_str[:20] + "..."
         
         return {
             "turn": self.turns,
             "action": move.tool, 
             "arg": arg_str, 
+            "arg_display": arg_display,
+            "path": path,
             "thought": move.thought,
             "context_len": total_tokens, 
             "limit": self.token_limit,
@@ -119,94 +147,77 @@ class StandardReActAgent:
         }
 
 def run_control_proof():
-    console = Console()
-    
-    # 1. Setup: The Haystack (Same as proof_cognitive_load.py)
-    noise_content = ("# DISTRACTOR FUNCTION\ndef noise_func_{i}():\n    return " + str([j for j in range(100)]) + "\n\n")
-    
-    # Create 3 large noise files 
-    for k in range(3):
-        with open(f"distractor_{k}.py", "w") as f:
-            for i in range(50): 
-                f.write(noise_content.format(i=i + (k*100)))
-    
-    # Create the Needle
-    with open("critical_logic.py", "w") as f:
-        f.write("def calculate_tax(amount):\n    return amount * 0.5 # BUG: Tax is too high")
-
-    console.print(Panel(
-        "[bold white]SCENARIO: The Distracted Mind (Control Group)[/bold white]\n" 
-        "[dim]A standard agent with huge context capacity attempts the needle-in-haystack task.[/dim]\n\n"
-        "[bold yellow]Hypothesis:[/bold yellow] Without Amnesic filtering, the agent will ingest the 'distractor' files,\n"
-        "bloating its context and potentially getting confused or timing out due to processing load.",
-        title="Control: Cognitive Load", border_style="red"
-    ))
-
-    mission = (
-        "MISSION: Find the function 'calculate_tax' and fix the tax rate to 0.05. "
-        "You have unlimited memory. Read everything you see to be sure."
-    )
-    
-    agent = StandardReActAgent(mission, token_limit=1232768)
+    console = CONSOLE
     
-    # 3. Telemetry Setup
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("Context Toks", "center", "white", 12),
-        ("Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 50),
-        ("Status", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
-    console.print(Panel("Execution Trace (Control)", style="bold red"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
-
-    failure_detected = False
-    
-    # 4. Execution
-    for i in range(10):
-        step = agent.step()
-        
-        row_data = (
-            str(step['turn']),
-            f"{step['context_len']}",
-            f"{step['action']}({step['arg'][:20]}...)",
-            step['thought'],
-            step['status']
+    try:
+        # 1. Setup: The Haystack (Same as proof_cognitive_load.py)
+        # Create 3 large noise files (one write per file)
+        for k in range(3):
+            blocks = [
+                f"# DISTRACTOR FUNCTION\ndef noise_func_{i}():\n    return {NOISE_DIGITS}\n\n"
+                for i in range(k * 100, k * 100 + 50)
+            ]
+            Path(f"distractor_{k}.py").write_text("".join(blocks))
+
+        # Create the Needle
+        Path("critical_logic.py").write_text("def calculate_tax(amount):\n    return amount * 0.5 # BUG: Tax is too high")
+
+        console.print(Panel(
+            "[bold white]SCENARIO: The Distracted Mind (Control Group)[/bold white]\n" 
+            "[dim]A standard agent with huge context capacity attempts the needle-in-haystack task.[/dim]\n\n"
+            "[bold yellow]Hypothesis:[/bold yellow] Without Amnesic filtering, the agent will ingest the 'distractor' files,\n"
+            "bloating its context and potentially getting confused or timing out due to processing load.",
+            title="Control: Cognitive Load", border_style="red"
+        ))
+
+        mission = (
+            "MISSION: Find the function 'calculate_tax' and fix the tax rate to 0.05. "
+            "You have unlimited memory. Read everything you see to be sure."
         )
-        print_stream_row(row_data)
 
-        # Failure Condition: It reads a distractor
-        if step['action'] == "read_file" and "distractor" in step['arg']:
-            failure_detected = True
-            console.print(Panel(f"[bold red]FAIL DETECTED:[/bold red] Agent ingested noise file '{step['arg']}'.\nCognitive load increased by ~5000 tokens unnecessary."))
-            break
-            
-        if step['action'] == "edit_file" and "critical_logic.py" in step['arg']:
-             console.print("[dim]Agent got lucky...[/dim]")
-             break
-             
-    if failure_detected:
-        console.print(Panel("[bold green]SUCCESS: Control proof demonstrated failure (Noise Ingestion).[/bold green]"))
-    else:
-        console.print(Panel("[bold yellow]INCONCLUSIVE: Agent avoided noise by chance.[/bold yellow]"))
-
-    # Cleanup
-    for f in ["critical_logic.py"] + [f"distractor_{k}.py" for k in range(3)]:
-        if os.path.exists(f): os.remove(f)
+        agent = StandardReActAgent(mission, token_limit=1232768)
+
+        console.print(Panel("Execution Trace (Control)", style="bold red"))
+        # Header and rule-separated rows share one Table, redrawn in place by Live
+        trace_table = make_trace_table(cols=COLS)
+
+        failure_detected = False
+        outcome = None
+
+        # 4. Execution
+        with live_trace(trace_table, console=console):
+            for i in range(10):
+                step = agent.step()
+
+                row_data = (
+                    str(step['turn']),
+                    f"{step['context_len']}",
+                    f"{step['action']}({step['arg_display']})",
+                    step['thought'],
+                    step['status']
+                )
+                trace_table.add_row(*row_data)
+
+                # Failure Condition: It reads a distractor
+                if step['action'] == "read_file" and os.path.basename(step['path']) in DISTRACTORS:
+                    failure_detected = True
+                    outcome = Panel(f"[bold red]FAIL DETECTED:[/bold red] Agent ingested noise file '{step['path']}'.\nCognitive load increased by ~5000 tokens unnecessary.")
+                    break
+
+                if step['action'] == "edit_file" and "critical_logic.py" in step['arg']:
+                     outcome = "[dim]Agent got lucky...[/dim]"
+                     break
+
+        if outcome:
+            console.print(outcome)
+
+        if failure_detected:
+            console.print(Panel("[bold green]SUCCESS: Control proof demonstrated failure (Noise Ingestion).[/bold green]"))
+        else:
+            console.print(Panel("[bold yellow]INCONCLUSIVE: Agent avoided noise by chance.[/bold yellow]"))
+    finally:
+        for p in CLEANUP:
+            p.unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_control_proof()
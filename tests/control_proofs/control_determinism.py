@@ -1,17 +1,34 @@
 import os
 import sys
 import json
-from rich.console import Console
-from rich.table import Table
+from concurrent.futures import ThreadPoolExecutor
 from rich.panel import Panel
 from rich.rule import Rule
 from rich.text import Text
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
+from tests.common.telemetry import CONSOLE, make_trace_table
+
+COLS = [
+    ("Run", "right", "cyan", 4),
+    ("Manager Action", "left", "yellow", 25),
+    ("Thought Process", "left", "italic dim", 50),
+    ("Status", "center", None, 8)
+]
+
+def _run_once(mission: str):
+    # NO deterministic_seed passed; each run gets its own session so there is no shared state
+    session = AmnesicSession(mission=mission, l1_capacity=2000)
+    return session.manager_node.decide(
+        state=session.state['framework_state'],
+        file_map=[],
+        pager=session.pager,
+        active_context="EMPTY"
+    )
 
 def run_control_determinism():
-    console = Console()
+    console = CONSOLE
     
     console.print(Panel(
         "[bold white]SCENARIO: Chaos Theory (Control: Determinism)[/bold white]\n"
@@ -21,56 +38,25 @@ def run_control_determinism():
     ))
 
     mission = "Calculate 123 * 456."
-    results = []
-    
-    COLS = [
-        ("Run", "right", "cyan", 4),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 50),
-        ("Status", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
     
     console.print(Panel("Execution Trace (Control)", style="bold red"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+    # All runs land in one Table (header + rule-separated rows), printed once
+    trace_table = make_trace_table(cols=COLS)
 
     # Run 5 times with DEFAULT temperature (usually 0.7 or 0.1 depending on driver default, but not 0.0)
-    for i in range(5):
-        # NO deterministic_seed passed
-        session = AmnesicSession(mission=mission, l1_capacity=2000)
-        
-        fw_state = session.state['framework_state']
-        current_map = [] 
-        pager = session.pager
-        
-        move = session.manager_node.decide(
-            state=fw_state,
-            file_map=current_map,
-            pager=pager,
-            active_context="EMPTY"
-        )
-        
-        results.append(move)
-        
+    # The runs are independent network-bound calls, so issue them concurrently.
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        results = list(pool.map(lambda _: _run_once(mission), range(5)))
+
+    for i, move in enumerate(results):
         row_data = (
             str(i + 1),
             f"{move.tool_call}({move.target})",
             move.thought_process,
             Text("CAPTURED", style="dim")
         )
-        print_stream_row(row_data)
+        trace_table.add_row(*row_data)
+    console.print(trace_table)
 
     # Analysis
     console.print(Rule("Analysis"))
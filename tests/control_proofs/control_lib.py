@@ -1,10 +1,12 @@
-import os
 import sys
 import json
 import logging
-from typing import Literal, Optional, Union
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Literal, Optional, Tuple, Union
 from pydantic import BaseModel, Field, ValidationError
 from amnesic.drivers.factory import get_driver
+from tests.common.telemetry import CONSOLE # Shared with the proofs; re-exported for the control scripts
 
 # Suppress library logging to avoid output spam
 logging.getLogger("amnesic.driver").setLevel(logging.CRITICAL)
@@ -24,56 +26,77 @@ class StandardReActAgent:
     - Uses a simple Sliding Window for context.
     - Persists history indefinitely until tokens run out.
     """
+    # Explicit Schema Injection in Prompt for Robustness
+    SCHEMA_DESC = (
+        "RESPONSE FORMAT (JSON ONLY):\n"
+        "{\n"
+        '  "thought": "Your reasoning here...",\n'
+        '  "action": "read_file" | "write_file" | "answer",\n'
+        '  "action_input": "filename" | "filename|content"\n'
+        "}\n"
+    )
+
+    # Everything after the mission line; identical for every agent and turn
+    STATIC_SYSTEM_PROMPT = (
+        "You are a standard ReAct agent with a single context window.\n"
+        "TOOLS AVAILABLE:\n"
+        "- read_file(path): Reads a file.\n"
+        "- write_file(path, content): Writes a file. ARGUMENT FORMAT: 'path|content'\n"
+        "- answer(result): Ends the mission.\n"
+        f"{SCHEMA_DESC}\n"
+        "Output JSON."
+    )
+
     def __init__(self, mission: str, model: str = "rnj-1:8b-cloud", token_limit: int = 32768):
         self.mission = mission
+        # Built once so the prompt prefix is byte-identical across turns
+        self._system_prompt = f"MISSION: {mission}\n" + self.STATIC_SYSTEM_PROMPT
+        self._system_tokens = len(self._system_prompt) // 4
         self.driver = get_driver("ollama", model)
         self.token_limit = token_limit
-        self.history = [] 
+        self.history = [] # Append-only
+        self._window: Deque[Tuple[str, int]] = deque() # (rendered message, tokens) newest-last
+        self._window_tokens = 0 # Running sum of tokens in _window
+        self._dropped = 0 # Oldest messages that no longer fit the window
         self.turns = 0
         self.last_file_read = "EMPTY"
         self.artifacts = {} # To track outputs
+        self._file_cache: Dict[str, str] = {} # Fixtures are static during a run
+
+    def _read_file(self, path: str) -> str:
+        """Reads a file once per session; raises FileNotFoundError if missing."""
+        try:
+            return self._file_cache[path]
+        except KeyError:
+            content = Path(path).read_text()
+            self._file_cache[path] = content
+            return content
+
+    def _append(self, role: str, content: str):
+        self.history.append({"role": role, "content": content})
+        line = f"{role}: {content}\n"
+        tokens = len(line) // 4
+        self._window.append((line, tokens))
+        self._window_tokens += tokens
 
     def step(self):
         self.turns += 1
         
-        # Explicit Schema Injection in Prompt for Robustness
-        schema_desc = (
-            "RESPONSE FORMAT (JSON ONLY):\n"
-            "{\n"
-            '  "thought": "Your reasoning here...",\n'
-            '  "action": "read_file" | "write_file" | "answer",\n'
-            '  "action_input": "filename" | "filename|content"\n'
-            "}\n"
-        )
-        
-        system_prompt = (
-            f"MISSION: {self.mission}\n"
-            "You are a standard ReAct agent with a single context window.\n"
-            "TOOLS AVAILABLE:\n"
-            "- read_file(path): Reads a file.\n"
-            "- write_file(path, content): Writes a file. ARGUMENT FORMAT: 'path|content'\n"
-            "- answer(result): Ends the mission.\n"
-            f"{schema_desc}\n"
-            "Output JSON."
-        )
+        system_prompt = self._system_prompt
         
         # Sliding Window Enforcement
-        context_tokens = len(system_prompt) // 4
-        active_history = []
-        
-        current_history_tokens = 0
-        hit_limit = False
-        
-        # Simple sliding window: Take newest messages first until limit
-        for msg in reversed(self.history):
-            msg_str = f"{msg['role']}: {msg['content']}\n"
-            msg_tokens = len(msg_str) // 4
-            if context_tokens + current_history_tokens + msg_tokens < self.token_limit:
-                active_history.insert(0, msg_str)
-                current_history_tokens += msg_tokens
-            else: 
-                hit_limit = True
-                break
+        context_tokens = self._system_tokens
+
+        # Simple sliding window: keep the newest messages that fit under the limit.
+        # History only grows, so a message that falls out never fits again.
+        while self._window and context_tokens + self._window_tokens >= self.token_limit:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
+            self._dropped += 1
+
+        hit_limit = self._dropped > 0
+        current_history_tokens = self._window_tokens
+        active_history = [line for line, _ in self._window]
                 
         full_prompt = system_prompt + "\n\n[HISTORY]\n" + "".join(active_history) + "\n\nAction (JSON):"
         total_tokens = context_tokens + current_history_tokens
@@ -86,9 +109,10 @@ class StandardReActAgent:
              )
         except Exception as e:
             # Catch validation errors gracefully
+            arg = f"Format Error: {str(e)[:50]}..."
             return {
                 "turn": self.turns,
-                "action": "error", "arg": f"Format Error: {str(e)[:50]}...", "thought": "Failed to parse output.", 
+                "action": "error", "arg": arg, "arg_display": arg[:20] + "...", "thought": "Failed to parse output.", 
                 "context_len": total_tokens, "limit": self.token_limit,
                 "file": self.last_file_read,
                 "window_status": "CRASH",
@@ -98,14 +122,17 @@ class StandardReActAgent:
         observation = ""
         if move.action == "read_file":
             self.last_file_read = move.action_input
-            if os.path.exists(move.action_input):
-                with open(move.action_input, 'r') as f: observation = f"FILE_CONTENT({move.action_input}):\n{f.read()}"
-            else: observation = f"ERROR: File {move.action_input} not found."
+            try:
+                content = self._read_file(move.action_input)
+                observation = f"FILE_CONTENT({move.action_input}):\n{content}"
+            except FileNotFoundError:
+                observation = f"ERROR: File {move.action_input} not found."
             
         elif move.action == "write_file":
             if "|" in move.action_input:
                 path, content = move.action_input.split("|", 1)
                 with open(path.strip(), 'w') as f: f.write(content)
+                self._file_cache.pop(path.strip(), None)
                 observation = f"File {path} written."
                 self.artifacts[path.strip()] = content
             else:
@@ -114,10 +141,12 @@ class StandardReActAgent:
         elif move.action == "answer": 
             observation = "Mission Complete."
             
-        self.history.append({"role": "assistant", "content": f"Call: {move.action}({move.action_input})"})
-        self.history.append({"role": "user", "content": f"Observation: {observation}"})
+        self._append("assistant", f"Call: {move.action}({move.action_input})")
+        self._append("user", f"Observation: {observation}")
         
         display_action = move.action
+        arg_str = move.action_input
+        arg_display = arg_str if len(arg_str) <= 20 else arg_str[:20] + "..."
         
         status_str = "OK"
         if hit_limit:
@@ -126,7 +155,8 @@ class StandardReActAgent:
         return {
             "turn": self.turns,
             "action": display_action, 
-            "arg": move.action_input, 
+            "arg": arg_str, 
+            "arg_display": arg_display,
             "thought": move.thought,
             "context_len": total_tokens, 
             "limit": self.token_limit,
@@ -6,16 +6,18 @@ The 'Dead Code' (Legacy) persists in context, consuming token budget.
 import sys
 import os
 import time
-from rich.console import Console
+from pathlib import Path
 from rich.panel import Panel
 from rich.progress import BarColumn, Progress, TextColumn
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from tests.control_proofs.control_lib import StandardReActAgent
+from tests.control_proofs.control_lib import CONSOLE, StandardReActAgent
 
-console = Console()
+console = CONSOLE
+
+CLEANUP = [Path("legacy_app.py"), Path("modern_app.py")]
 
 def run_control_rosetta():
     console.print(Panel(
@@ -28,51 +30,51 @@ def run_control_rosetta():
         title="Control Proof: Rosetta Stone", border_style="red"
     ))
 
-    # 1. Setup Legacy File
-    legacy_code = "# SPAGHETTI CODE\n" + "GOTO 10\nPERFORM ROUTINE_X\n" * 30 # ~600 chars
-    with open("legacy_app.py", "w") as f:
-        f.write(legacy_code)
+    try:
+        # 1. Setup Legacy File
+        legacy_code = "# SPAGHETTI CODE\n" + "GOTO 10\nPERFORM ROUTINE_X\n" * 30 # ~600 chars
+        with open("legacy_app.py", "w") as f:
+            f.write(legacy_code)
+
+        mission = (
+            "MISSION: Read 'legacy_app.py'. "
+            "Translate it to Python (mock it) and write to 'modern_app.py'. "
+            "Use 'write_file' with format 'path|content'. "
+            "Then call 'answer'."
+        )
+
+        # Use small limit to exacerbate the issue
+        agent = StandardReActAgent(mission, token_limit=1000)
+
+        # 2. Execution
+        console.print(Panel("Execution Trace", style="bold red"))
+
+        final_context_len = 0
+        final_snapshot = ""
+
+        for i in range(10):
+            step = agent.step()
+            console.print(f"[Turn {step['turn']}] {step['action']} (Ctx: {step['context_len']}/{step['limit']})")
 
-    mission = (
-        "MISSION: Read 'legacy_app.py'. "
-        "Translate it to Python (mock it) and write to 'modern_app.py'. "
-        "Use 'write_file' with format 'path|content'. "
-        "Then call 'answer'."
-    )
+            if step['action'] == "answer":
+                final_context_len = step['context_len']
+                final_snapshot = step['full_context_snapshot']
+                console.print("[bold green]Mission Complete.[/bold green]")
+                break
 
-    # Use small limit to exacerbate the issue
-    agent = StandardReActAgent(mission, token_limit=1000)
-    
-    # 2. Execution
-    console.print(Panel("Execution Trace", style="bold red"))
-    
-    final_context_len = 0
-    final_snapshot = ""
-    
-    for i in range(10):
-        step = agent.step()
-        console.print(f"[Turn {step['turn']}] {step['action']} (Ctx: {step['context_len']}/{step['limit']})")
-        
-        if step['action'] == "answer":
-            final_context_len = step['context_len']
-            final_snapshot = step['full_context_snapshot']
-            console.print("[bold green]Mission Complete.[/bold green]")
-            break
-            
-    # 3. Efficiency Audit
-    console.print(Panel("[bold]Post-Operation Efficiency Audit[/bold]", style="yellow"))
-    
-    # Check if Legacy code is still in context
-    if "PERFORM ROUTINE_X" in final_snapshot:
-        console.print("[bold red]✖ FAIL: Context Pollution Detected[/bold red]")
-        console.print(f"   Legacy code remains in context usage ({final_context_len} tokens).")
-        console.print("   The agent is paying for code it no longer needs.")
-    else:
-        console.print("[bold green]✔ PASS: Legacy code evicted (Unexpected for Standard Agent).[/bold green]")
+        # 3. Efficiency Audit
+        console.print(Panel("[bold]Post-Operation Efficiency Audit[/bold]", style="yellow"))
 
-    # Cleanup
-    if os.path.exists("legacy_app.py"): os.remove("legacy_app.py")
-    if os.path.exists("modern_app.py"): os.remove("modern_app.py")
+        # Check if Legacy code is still in context
+        if "PERFORM ROUTINE_X" in final_snapshot:
+            console.print("[bold red]✖ FAIL: Context Pollution Detected[/bold red]")
+            console.print(f"   Legacy code remains in context usage ({final_context_len} tokens).")
+            console.print("   The agent is paying for code it no longer needs.")
+        else:
+            console.print("[bold green]✔ PASS: Legacy code evicted (Unexpected for Standard Agent).[/bold green]")
+    finally:
+        for p in CLEANUP:
+            p.unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_control_rosetta()
\ No newline at end of file
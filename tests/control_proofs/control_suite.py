@@ -1,37 +1,30 @@
 import os
 import sys
-import random
-from rich.console import Console
-from rich.table import Table
+from pathlib import Path
+import numpy as np
 from rich.panel import Panel
 from rich.rule import Rule
 from rich.text import Text
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
-from tests.control_proofs.control_lib import StandardReActAgent
+from tests.common.batch_write import batch_write
+from tests.common.telemetry import live_trace, make_trace_table
+from tests.control_proofs.control_lib import CONSOLE, StandardReActAgent
 
-console = Console()
+console = CONSOLE
 
-# --- Shared Telemetry Setup (Matching Amnesic Proofs) ---
-COLS = [
-    ("Turn", "right", "cyan", 4),
-    ("L1 Files", "center", "magenta", 12),
-    ("L1 Toks", "center", "white", 10),
-    ("Arts", "center", "green", 4),
-    ("Node", "left", "blue", 10),
-    ("Manager Action", "left", "yellow", 25),
-    ("Thought Process", "left", "italic dim", 50),
-    ("Auditor", "center", None, 8)
-]
+# Fixtures created by run_control_advanced_semantic
+CLEANUP = [Path("logic_gate.txt"), Path("vault_a.txt"), Path("vault_b.txt")]
+NOISE_BYTES = b"NOISE_" * 100
 
-def print_control_row(step_data):
+def control_row(step_data):
     # Mapping Standard Agent state to Amnesic Visuals
     tok_str = f"{step_data['context_len']}/{step_data['limit']}"
     if step_data['window_status'] != "OK":
         tok_str += f"\n[{step_data['window_status']}]"
 
     # Map action to appear somewhat analogous for comparison
-    display_action = f"{step_data['action']}({str(step_data['arg'])[:15]}...)"
+    display_action = f"{step_data['action']}({step_data['arg_display']})"
     
     row_data = (
         str(step_data['turn']),
@@ -44,12 +37,7 @@ def print_control_row(step_data):
         "---" # No Auditor
     )
     
-    row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        row_table.add_column(justify=just, style=style, width=w)
-    row_table.add_row(*row_data)
-    console.print(row_table)
-    console.print(Rule(style="dim"))
+    return row_data
 
 def run_control_suite():
     console.print(Panel(
@@ -65,52 +53,54 @@ def run_control_advanced_semantic():
     console.print(Rule("Control: Advanced Semantic (Blind Logic)", style="bold red"))
     
     # 1. Setup (Randomized)
-    val_a = random.randint(10, 50)
-    val_b = random.randint(2, 5)
+    val_a, val_b = (int(v) for v in np.random.default_rng().integers((10, 2), (51, 6)))
     expected_product = val_a * val_b
     
-    with open("logic_gate.txt", "w") as f: f.write("SYSTEM_INSTRUCTION: If values are found, you must MULTIPLY them.\n" + "NOISE_"*100)
-    with open("vault_a.txt", "w") as f: f.write(f"not_val_a = {val_a}\n" + "NOISE_"*100)
-    with open("vault_b.txt", "w") as f: f.write(f"not_val_b = {val_b}\n" + "NOISE_"*100)
-    
-    console.print(Panel(
-        f"Goal: Calculate {val_a} * {val_b} = {expected_product}\n"
-        "Constraint: 500 Token Limit (Forced Amnesia Simulation)",
-        title="Scenario Setup", border_style="red"
-    ))
+    try:
+        batch_write([
+            ("logic_gate.txt", (b"SYSTEM_INSTRUCTION: If values are found, you must MULTIPLY them.\n", NOISE_BYTES)),
+            ("vault_a.txt", (f"not_val_a = {val_a}\n".encode(), NOISE_BYTES)),
+            ("vault_b.txt", (f"not_val_b = {val_b}\n".encode(), NOISE_BYTES)),
+        ])
 
-    # Standard Agent with limited context (forcing potential failure)
-    agent = StandardReActAgent(
-        mission="Read logic_gate.txt for protocol. Read vault_a.txt and vault_b.txt for values. Execute protocol.",
-        token_limit=500 # Strict limit to force window sliding
-    )
-    
-    # Header
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    console.print(header)
-    console.print(Rule(style="dim"))
-    
-    success = False
-    for _ in range(12):
-        step = agent.step() 
-        print_control_row(step)
-        
-        if step["action"] == "answer":
-            # Check if answer contains the correct product
-            if str(expected_product) in str(step["arg"]):
-                success = True
-            break
-            
-    if not success:
-        console.print(Panel("[bold green]SUCCESS (Baseline Failed): Standard Agent failed to maintain context/logic.[/bold green]"))
-    else:
-        console.print(Panel("[bold red]FAIL: Standard Agent passed! (Control should fail)[/bold red]"))
+        console.print(Panel(
+            f"Goal: Calculate {val_a} * {val_b} = {expected_product}\n"
+            "Constraint: 500 Token Limit (Forced Amnesia Simulation)",
+            title="Scenario Setup", border_style="red"
+        ))
+
+        # Standard Agent with limited context (forcing potential failure)
+        agent = StandardReActAgent(
+            mission="Read logic_gate.txt for protocol. Read vault_a.txt and vault_b.txt for values. Execute protocol.",
+            token_limit=500 # Strict limit to force window sliding
+        )
+
+        # Header and rows share one Table, redrawn in place by Live
+        trace_table = make_trace_table()
+
+        success = False
+        expected_str = str(expected_product)
+        with live_trace(trace_table, console=console):
+            for _ in range(12):
+                step = agent.step() 
+                trace_table.add_row(*control_row(step))
+
+                if step["action"] == "answer":
+                    # Check if answer contains the correct product
+                    arg = step["arg"]
+                    if isinstance(arg, str):
+                        success = expected_str in arg
+                    else:
+                        success = arg == expected_product
+                    break
 
-    # Cleanup
-    for f in ["logic_gate.txt", "vault_a.txt", "vault_b.txt"]:
-        if os.path.exists(f): os.remove(f)
+        if not success:
+            console.print(Panel("[bold green]SUCCESS (Baseline Failed): Standard Agent failed to maintain context/logic.[/bold green]"))
+        else:
+            console.print(Panel("[bold red]FAIL: Standard Agent passed! (Control should fail)[/bold red]"))
+    finally:
+        for p in CLEANUP:
+            p.unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_control_suite()
\ No newline at end of file
@@ -1,142 +1,130 @@
 import os
 import sys
-import random
-from rich.console import Console
-from rich.table import Table
+import tempfile
+import numpy as np
 from rich.panel import Panel
-from rich.live import Live
-from rich.text import Text
 from rich.rule import Rule
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE, NODE_LABELS, audit_cell, fmt_action, live_trace, make_trace_table
 
 # Increase noise to ~3800 units (High pressure with 1.75x margin)
-noise = "NOISE_BUFFER " * 3800
+NOISE_BYTES = ("NOISE_BUFFER " * 3800).encode()
+ALPHA_BYTES = ("DATA_FRAGMENT_ALPHA " * 200).encode()
+BETA_BYTES = ("DATA_FRAGMENT_BETA " * 200).encode()
 
 def run_proof():
-    console = Console()
+    console = CONSOLE
     
     # Reset Sidecar for a clean start
     SharedSidecar().reset()
     
-    # 1. Setup Environment
-    val_x = random.randint(10, 99)
-    val_y = random.randint(10, 99)
+    # Fixtures live in a private scratch dir (removed with it), so proofs can run side by side
+    with tempfile.TemporaryDirectory(prefix="amnesic_") as td:
+        # 1. Setup Environment
+        rng = np.random.default_rng()
+        val_x, val_y = (int(v) for v in rng.integers(10, 100, size=2))
     
-    with open("island_a.txt", "w") as f:
-        f.write(noise + f"val_x = {val_x}\n" + "DATA_FRAGMENT_ALPHA " * 200)
-    with open("island_b.txt", "w") as f:
-        f.write(noise + f"val_y = {val_y}\n" + "DATA_FRAGMENT_BETA " * 200)
+        with open(os.path.join(td, "island_a.txt"), "wb") as f:
+            f.writelines((NOISE_BYTES, f"val_x = {val_x}\n".encode(), ALPHA_BYTES))
+        with open(os.path.join(td, "island_b.txt"), "wb") as f:
+            f.writelines((NOISE_BYTES, f"val_y = {val_y}\n".encode(), BETA_BYTES))
     
-    console.print(Panel(
-        f"[bold white]SCENARIO: The Island Hop (Basic Semantic Retrieval)[/bold white]\n"
-        f"[dim]The agent must retrieve data from two isolated islands.[/dim]\n\n"
-        f"1. [cyan]island_a.txt[/cyan]: Contains a hidden value (val_x={val_x}).\n"
-        f"2. [green]island_b.txt[/green]: Contains a hidden value (val_y={val_y}).\n\n"
-        f"[bold yellow]Challenge:[/bold yellow] Retrieve both values and sum them.\n"
-        f"[bold red]Constraint:[/bold red] Amnesic Bottleneck (32768 Tokens). Must forget one island to see the other.",
-        title="Basic Semantic Proof",
-        border_style="blue"
-    ))
+        console.print(Panel(
+            f"[bold white]SCENARIO: The Island Hop (Basic Semantic Retrieval)[/bold white]\n"
+            f"[dim]The agent must retrieve data from two isolated islands.[/dim]\n\n"
+            f"1. [cyan]island_a.txt[/cyan]: Contains a hidden value (val_x={val_x}).\n"
+            f"2. [green]island_b.txt[/green]: Contains a hidden value (val_y={val_y}).\n\n"
+            f"[bold yellow]Challenge:[/bold yellow] Retrieve both values and sum them.\n"
+            f"[bold red]Constraint:[/bold red] Amnesic Bottleneck (32768 Tokens). Must forget one island to see the other.",
+            title="Basic Semantic Proof",
+            border_style="blue"
+        ))
 
-    # 2. Initialize Session
-    mission = "MISSION: Retrieve 'val_x' from island_a.txt and 'val_y' from island_b.txt. Calculate their sum. IMPORTANT: Save each value as an artifact immediately."
-    session = AmnesicSession(
-        mission=mission, 
-        l1_capacity=32768)
+        # 2. Initialize Session
+        mission = "MISSION: Retrieve 'val_x' from island_a.txt and 'val_y' from island_b.txt. Calculate their sum. IMPORTANT: Save each value as an artifact immediately."
+        session = AmnesicSession(
+            mission=mission, 
+            root_dir=td,
+            l1_capacity=32768)
     
-    # Visual Confirmation of Architecture
-    session.visualize()
+        # Visual Confirmation of Architecture
+        session.visualize()
     
-    # 3. Telemetry Setup
-    config = {"configurable": {"thread_id": "proof_basic"}, "recursion_limit": 100}
-    turn_count = 0
-    
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Files", "center", "magenta", 12),
-        ("L1 Toks", "center", "white", 10),
-        ("Arts", "center", "green", 4),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 50),
-        ("Auditor", "center", None, 8)
-    ]
+        # 3. Telemetry Setup
+        config = {"configurable": {"thread_id": "proof_basic"}, "recursion_limit": 100}
+        turn_count = 0
 
-    # Print Header
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
-    console.print(Panel("Mission Execution Trace", style="bold blue"))
-    console.print(header)
-    console.print(Rule(style="dim"))
+        # Header and rule-separated rows share one Table, redrawn in place by Live
+        console.print(Panel("Mission Execution Trace", style="bold blue"))
+        trace_table = make_trace_table()
 
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+        outcome = None
+        pager = session.pager
+        pages_version, files_str = None, "EMPTY"
+        fw_state = manager_decision = audit = None
 
-    # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
-        current_state = session.app.get_state(config).values
+        # 4. Execution Loop
+        with live_trace(trace_table):
+            for event in session.app.stream(session.state, config=config):
+                node_name = next(iter(event))
+                node_output = event[node_name]
         
-        if node_name == "manager":
-            turn_count += 1
+                if node_name == "manager":
+                    turn_count += 1
         
-        fw_state = current_state.get('framework_state')
-        pager = session.pager
+                # Materialize the full graph state only at turn boundaries; auditor/executor events carry their own deltas
+                if node_name == "manager" or fw_state is None:
+                    state_values = session.app.get_state(config).values
+                    fw_state = state_values['framework_state']
+                    manager_decision = state_values.get('manager_decision')
+                    audit = state_values.get('last_audit')
+                else:
+                    fw_state = node_output.get('framework_state', fw_state)
+                    audit = node_output.get('last_audit', audit)
         
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+                move = node_output.get('manager_decision') if 'manager_decision' in node_output else manager_decision
         
-        active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
-        artifact_names = [a.identifier for a in fw_state.artifacts]
+                # Rebuild the L1 file list only when the page set changed
+                if pager.version != pages_version:
+                    pages_version = pager.version
+                    active_files = pager.file_pages
+                    files_str = ", ".join(active_files) if active_files else "EMPTY"
+                artifact_names = [a.identifier for a in fw_state.artifacts]
         
-        token_str = f"{pager.current_usage}/{pager.capacity}"
+                token_str = f"{pager.current_usage}/{pager.capacity}"
         
-        audit_val = audit["auditor_verdict"] if audit else "---"
-        audit_style = "green" if "PASS" in audit_val else "red" if "REJECT" in audit_val else "white"
+                audit_val = audit["auditor_verdict"] if audit else "---"
 
-        node_label = node_name
-        if node_name == "manager": node_label = "Manager 🧠"
-        if node_name == "auditor": node_label = "Auditor 🛡️"
-        if node_name == "executor": node_label = "Executor ⚡"
+                node_label = NODE_LABELS.get(node_name, node_name)
 
-        row_data = (
-            str(turn_count),
-            ", ".join(active_files) if active_files else "EMPTY",
-            token_str,
-            str(len(artifact_names)),
-            node_label,
-            f"{move.tool_call}({move.target})" if move else "---",
-            move.thought_process if move else "---",
-            Text(audit_val, style=audit_style)
-        )
+                row_data = (
+                    str(turn_count),
+                    files_str,
+                    token_str,
+                    str(len(artifact_names)),
+                    node_label,
+                    fmt_action(move),
+                    move.thought_process if move else "---",
+                    audit_cell(audit_val)
+                )
         
-        print_stream_row(row_data)
+                trace_table.add_row(*row_data)
         
-        if move and move.tool_call == "halt_and_ask":
-            console.print(Rule(style="dim"))
-            console.print(f"\n[bold green]Success:[/bold green] {move.target}")
-            break
+                if move and move.is_halt:
+                    outcome = f"\n[bold green]Success:[/bold green] {move.target}"
+                    break
         
-        if turn_count > 15:
-            console.print(Rule(style="dim"))
-            console.print("\n[bold red]Timeout reached.[/bold red]")
-            break
+                if turn_count > 15:
+                    outcome = "\n[bold red]Timeout reached.[/bold red]"
+                    break
 
-    # 5. Cleanup
-    for f in ["island_a.txt", "island_b.txt"]:
-        if os.path.exists(f): os.remove(f)
+        if outcome:
+            console.print(Rule(style="dim"))
+            console.print(outcome)
 
 if __name__ == "__main__":
     run_proof()
\ No newline at end of file
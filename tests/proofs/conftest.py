@@ -0,0 +1,7 @@
+import sys
+import pathlib
+
+# Repo root goes on sys.path once for the whole proofs package; the scripts only add it when run directly
+ROOT = str(pathlib.Path(__file__).resolve().parents[2])
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
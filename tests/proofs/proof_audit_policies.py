@@ -1,10 +1,9 @@
 import os
 import sys
 import unittest
-from unittest.mock import MagicMock
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.core.audit_policies import FLUID_READ, STRICT_AUDIT
 from amnesic.presets.code_agent import ManagerMove
@@ -29,8 +28,9 @@ def run_deterministic_audit_proof():
         ManagerMove(thought_process="Mission is complete, halting the session now.", tool_call="halt_and_ask", target="Mission Complete")
     ]
     
-    # Mock the manager's decide method
-    session.manager_node.decide = MagicMock(side_effect=moves)
+    # Replay the scripted moves (a plain closure; no mock call bookkeeping needed)
+    _moves = iter(moves)
+    session.manager_node.decide = lambda *args, **kwargs: next(_moves)
     
     # 3. Use patch to control ALL Auditor instances created by the session
     from unittest.mock import patch
@@ -55,7 +55,7 @@ def run_deterministic_audit_proof():
     with patch('amnesic.core.session.Auditor') as MockAuditor:
         # Setup the mock instance
         instance = MockAuditor.return_value
-        instance.evaluate_move.side_effect = mock_evaluate_move
+        instance.evaluate_move = mock_evaluate_move
 
         # 4. Run the mission
         print("Running deterministic mission...")
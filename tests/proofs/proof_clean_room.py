@@ -5,17 +5,18 @@ extract safe patterns, and permanently discard the sensitive context.
 """
 import sys
 import os
-from rich.console import Console
+import tempfile
 from rich.panel import Panel
 from rich.syntax import Syntax
 
 # Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from amnesic.presets.clean_room import CleanRoomSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE
 
-console = Console()
+console = CONSOLE
 
 def run_clean_room_proof():
     # Reset Sidecar for a clean start
@@ -30,8 +31,10 @@ def run_clean_room_proof():
         title="Application: Clean Room", border_style="red"
     ))
 
-    # 1. Create Sensitive File
-    secret_code = """
+    # Fixtures live in a private scratch dir (removed with it), so proofs can run side by side
+    with tempfile.TemporaryDirectory(prefix="amnesic_") as td:
+        # 1. Create Sensitive File
+        secret_code = """
 class PaymentProcessor:
     def __init__(self):
         self.api_key = "sk-LIVE-9999-SECRET-DONT-SHARE" # SECRET!
@@ -45,87 +48,85 @@ class PaymentProcessor:
     def _send_to_bank(self, key, amt):
         print(f"Sending {amt} using {key}")
 """
-    with open("secret_core.py", "w") as f:
-        f.write(secret_code)
+        with open(os.path.join(td, "secret_core.py"), "w") as f:
+            f.write(secret_code)
 
-    console.print("[bold]1. Created Sensitive File (secret_core.py)[/bold]")
-    console.print(Syntax(secret_code, "python", theme="monokai", line_numbers=True))
+        console.print("[bold]1. Created Sensitive File (secret_core.py)[/bold]")
+        console.print(Syntax(secret_code, "python", theme="monokai", line_numbers=True))
 
-    # 2. Initialize Session
-    mission = (
-        "MISSION: Create a public STUB file (interface only) for 'secret_core.py'. "
-        "Keep method signatures. "
-        "REPLACE all literal values (strings/numbers) with 'REDACTED'. "
-        "REMOVE any internal comments about algorithms."
-    )
+        # 2. Initialize Session
+        mission = (
+            "MISSION: Create a public STUB file (interface only) for 'secret_core.py'. "
+            "Keep method signatures. "
+            "REPLACE all literal values (strings/numbers) with 'REDACTED'. "
+            "REMOVE any internal comments about algorithms."
+        )
     
-    session = CleanRoomSession(mission=mission, l1_capacity=32768, model="rnj-1:8b-cloud", base_url="http://localhost:11434")
+        session = CleanRoomSession(mission=mission, root_dir=td, l1_capacity=32768, model="rnj-1:8b-cloud", base_url="http://localhost:11434")
     
-    # 3. Run (Simulation Loop)
-    # We'll use the .stream() via .run() but limited turns
-    console.print("\n[bold]2. Engaging Clean Room Agent...[/bold]")
+        # 3. Run (Simulation Loop)
+        # We'll use the .stream() via .run() but limited turns
+        console.print("\n[bold]2. Engaging Clean Room Agent...[/bold]")
     
-    # We manually drive it to ensure we capture the state transitions or just use run()
-    # Using a simple loop to check artifacts
+        # We manually drive it to ensure we capture the state transitions or just use run()
+        # Using a simple loop to check artifacts
     
-    config = {"configurable": {"thread_id": "clean_room_proof"}, "recursion_limit": 100}
+        config = {"configurable": {"thread_id": "clean_room_proof"}, "recursion_limit": 100}
     
-    step_count = 0
-    success = False
+        step_count = 0
+        success = False
+        pager = session.pager
     
-    for event in session.app.stream(session.state, config=config):
-        step_count += 1
-        current_state = session.app.get_state(config).values
-        if not current_state: current_state = session.state
+        for event in session.app.stream(session.state, config=config):
+            step_count += 1
+            current_state = session.app.get_state(config).values
+            if not current_state: current_state = session.state
         
-        fw = current_state['framework_state']
+            fw = current_state['framework_state']
         
-        # Display artifacts as they appear
-        if fw.artifacts and not success:
-            last_art = fw.artifacts[-1]
-            console.print(f"[Turn {step_count}] Artifact Created: [blue]{last_art.identifier}[/blue]")
-            console.print(Panel(last_art.summary, title="Artifact Content", style="blue"))
-            success = True
-            # DO NOT break here, let it sanitize L1
+            # Display artifacts as they appear
+            if fw.artifacts and not success:
+                last_art = fw.artifacts[-1]
+                console.print(f"[Turn {step_count}] Artifact Created: [blue]{last_art.identifier}[/blue]")
+                console.print(Panel(last_art.summary, title="Artifact Content", style="blue"))
+                success = True
+                # DO NOT break here, let it sanitize L1
             
-        # Break if mission complete and L1 empty
-        active_user_files = [k for k in session.pager.active_pages.keys() if "SYS:" not in k]
-        if success and not active_user_files:
-            console.print(f"[Turn {step_count}] Sanitization Complete. L1 is empty.")
-            break
+            # Break if mission complete and L1 empty
+            active_user_files = [k for k in pager.active_pages if not k.startswith("SYS:")]
+            if success and not active_user_files:
+                console.print(f"[Turn {step_count}] Sanitization Complete. L1 is empty.")
+                break
             
-        if step_count > 20:
-            console.print("[red]Timeout: Agent failed to complete sanitization.[/red]")
-            break
+            if step_count > 20:
+                console.print("[red]Timeout: Agent failed to complete sanitization.[/red]")
+                break
 
-    # 4. Verify Hygiene
-    console.print("\n[bold]3. Security Audit[/bold]")
+        # 4. Verify Hygiene
+        console.print("\n[bold]3. Security Audit[/bold]")
     
-    # Check Artifacts for Secrets
-    forbidden = ["sk-LIVE", "admin@company.com", "9999"]
-    is_clean = session.verify_hygiene(forbidden)
+        # Check Artifacts for Secrets
+        forbidden = ["sk-LIVE", "admin@company.com", "9999"]
+        is_clean = session.verify_hygiene(forbidden)
     
-    if is_clean:
-        console.print("[bold green]✔ PASS: No secrets found in Artifacts.[/bold green]")
-    else:
-        console.print("[bold red]✖ FAIL: Secrets leaked into Artifacts![/bold red]")
-        sys.exit(1)
+        if is_clean:
+            console.print("[bold green]✔ PASS: No secrets found in Artifacts.[/bold green]")
+        else:
+            console.print("[bold red]✖ FAIL: Secrets leaked into Artifacts![/bold red]")
+            sys.exit(1)
         
-    # Check L1 Memory (Should be empty of the file)
-    l1_files = list(session.pager.active_pages.keys())
-    console.print(f"L1 Status: {l1_files}")
+        # Check L1 Memory (Should be empty of the file)
+        l1_files = list(session.pager.active_pages.keys())
+        console.print(f"L1 Status: {l1_files}")
     
-    # Note: L1 might contain the "Stub" if it was just created, but strictly speaking 
-    # the 'secret_core.py' should be evicted if we followed the 'save_artifact' rule which evicts 'FILE:*'
-    # The session._tool_worker_task does: "for file_id in active_files: self.pager.evict_to_l2(file_id)"
+        # Note: L1 might contain the "Stub" if it was just created, but strictly speaking 
+        # the 'secret_core.py' should be evicted if we followed the 'save_artifact' rule which evicts 'FILE:*'
+        # The session._tool_worker_task does: "for file_id in active_files: self.pager.evict_to_l2(file_id)"
     
-    if any("secret_core.py" in f for f in l1_files):
-        console.print("[bold red]✖ FAIL: Source file still in L1 Context![/bold red]")
-    else:
-        console.print("[bold green]✔ PASS: Source file evicted from L1.[/bold green]")
-
-    # Cleanup
-    if os.path.exists("secret_core.py"): os.remove("secret_core.py")
+        if any("secret_core.py" in f for f in l1_files):
+            console.print("[bold red]✖ FAIL: Source file still in L1 Context![/bold red]")
+        else:
+            console.print("[bold green]✔ PASS: Source file evicted from L1.[/bold green]")
 
 if __name__ == "__main__":
     run_clean_room_proof()
@@ -1,27 +1,24 @@
 import os
 import sys
-from rich.console import Console
-from rich.table import Table
+from pathlib import Path
 from rich.panel import Panel
 from rich.rule import Rule
 from rich.columns import Columns
-from rich.text import Text
 from rich.syntax import Syntax
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
-
-noise = "NOISE_BUFFER " * 15000
+from tests.common.telemetry import CONSOLE, NODE_LABELS, audit_cell, live_trace, make_trace_table
 
 def run_code_advanced_proof():
-    console = Console()
+    console = CONSOLE
     
     # 1. Setup: API and Client
     api_code = "def login(username):\n    print(f'Logging in {username}')"
     client_code = "import api\n\ndef main():\n    api.login('admin')"
     
-    with open("api.py", "w") as f: f.write(api_code)
-    with open("client.py", "w") as f: f.write(client_code)
+    Path("api.py").write_text(api_code)
+    Path("client.py").write_text(client_code)
 
     # 2. Initialize Session
     mission = (
@@ -65,100 +62,84 @@ def run_code_advanced_proof():
     turn_count = 0
     
     # 3. Telemetry Setup
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Files", "center", "magenta", 12),
-        ("L1 Toks", "center", "white", 10),
-        ("Arts", "center", "green", 4),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 50),
-        ("Auditor", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
+    # Header and rule-separated rows share one Table, redrawn in place by Live
     console.print(Panel("Mission Execution Trace", style="bold blue"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+    trace_table = make_trace_table()
+    outcome = None
     
     # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
+    state_cache = dict(session.state)
+    pager = session.pager
+    prev_sig = None
+    with live_trace(trace_table):
+        for event in session.app.stream(session.state, config=config):
+            node_name = next(iter(event))
+            node_output = event[node_name]
         
-        current_state = session.app.get_state(config).values
-        if not current_state: current_state = session.state
+            # Graph nodes return plain overwrites (no reducers), so overlaying each delta mirrors the checkpoint
+            state_cache.update(node_output)
+            current_state = state_cache
             
-        fw_state = current_state.get('framework_state')
-        pager = session.pager
+            fw_state = current_state.get('framework_state')
         
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+            move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+            audit = current_state.get('last_audit')
         
-        if node_name == "manager":
-            turn_count += 1
+            if node_name == "manager":
+                turn_count += 1
         
-        active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
-        artifact_names = [a.identifier for a in fw_state.artifacts]
-        token_str = f"{pager.current_usage}/{pager.capacity}"
-        
-        audit_val = audit["auditor_verdict"] if audit else "---"
-        audit_style = "green" if audit_val == "PASS" else "red" if audit_val == "REJECT" else "white"
-
-        node_label = node_name
-        if node_name == "manager": node_label = "Manager 🧠"
-        if node_name == "auditor": node_label = "Auditor 🛡️"
-        if node_name == "executor": node_label = "Executor ⚡"
+            # The pager caches this view until its page set changes
+            active_files = pager.file_pages
 
-        if move:
-            row_data = (
-                str(turn_count),
-                ", ".join(active_files) if active_files else "EMPTY",
-                token_str,
-                str(len(artifact_names)),
-                node_label,
-                f"{move.tool_call}({move.target})" if move else "---",
-                move.thought_process if move else "---",
-                Text(audit_val, style=audit_style)
-            )
-            print_stream_row(row_data)
+            if move:
+                # Row cells are only worth building for events that actually print
+                audit_val = audit["auditor_verdict"] if audit else "---"
+                # Same-turn auditor/executor echoes that changed nothing (same move, L1 and audit) collapse into one row;
+                # the turn stays in the signature so a manager repeating itself on a new turn is still shown
+                row_sig = (turn_count, move, active_files, pager.current_usage, len(fw_state.artifacts), audit_val)
+                if row_sig != prev_sig:
+                    prev_sig = row_sig
+                    row_data = (
+                        str(turn_count),
+                        ", ".join(active_files) if active_files else "EMPTY",
+                        f"{pager.current_usage}/{pager.capacity}",
+                        str(len(fw_state.artifacts)),
+                        NODE_LABELS.get(node_name, node_name),
+                        f"{move.tool_call}({move.target})",
+                        move.thought_process,
+                        audit_cell(audit_val)
+                    )
+                    trace_table.add_row(*row_data)
 
-            # Check progress (Success Condition)
-            with open("api.py", "r") as f: api_content = f.read()
-            with open("client.py", "r") as f: client_content = f.read()
+            # Check progress (Success Condition); only the executor writes files
+            if move and node_name == "executor":
+                with open("api.py", "r") as f: api_content = f.read()
+                with open("client.py", "r") as f: client_content = f.read()
             
-            api_fixed = "password" in api_content
-            client_fixed = "password123" in client_content
+                api_fixed = "password" in api_content
+                client_fixed = "password123" in client_content
             
-            if api_fixed and client_fixed:
-                console.print(Panel(
-                    Columns([
-                        Panel(Syntax(api_content, "python", theme="monokai", line_numbers=True), title="api.py (Fixed)"),
-                        Panel(Syntax(client_content, "python", theme="monokai", line_numbers=True), title="client.py (Fixed)")
-                    ]),
-                    title="[bold green]SUCCESS: System Synchronized[/bold green]",
-                    border_style="green"
-                ))
-                break
+                if api_fixed and client_fixed:
+                    outcome = Panel(
+                        Columns([
+                            Panel(Syntax(api_content, "python", theme="monokai", line_numbers=True), title="api.py (Fixed)"),
+                            Panel(Syntax(client_content, "python", theme="monokai", line_numbers=True), title="client.py (Fixed)")
+                        ]),
+                        title="[bold green]SUCCESS: System Synchronized[/bold green]",
+                        border_style="green"
+                    )
+                    break
         
-        if turn_count > 15:
-            console.print("[bold red]FAIL: Timeout.[/bold red]")
-            break
+            if turn_count > 15:
+                outcome = "[bold red]FAIL: Timeout.[/bold red]"
+                break
+
+    if outcome:
+        console.print(outcome)
 
     # Cleanup
     for f in ["api.py", "client.py"]:
-        if os.path.exists(f): os.remove(f)
+        Path(f).unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_code_advanced_proof()
\ No newline at end of file
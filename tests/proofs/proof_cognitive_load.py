@@ -1,27 +1,28 @@
 import os
 import sys
-import time
-from rich.console import Console
-from rich.table import Table
+from pathlib import Path
 from rich.panel import Panel
-from rich.rule import Rule
-from rich.text import Text
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
+from tests.common.telemetry import CONSOLE, NODE_LABELS, audit_cell, live_trace, make_trace_table
+
+# Return value shared by every distractor function
+NOISE_RETURN = str(list(range(100)))
 
 def run_cognitive_load_proof():
-    console = Console()
+    console = CONSOLE
     
     # 1. Setup: The Haystack
     # We create massive "Distractor" files and one "Signal" file.
-    noise_content = ("# DISTRACTOR FUNCTION\ndef noise_func_{i}():\n    return " + str([j for j in range(100)]) + "\n\n")
-    
-    # Create 3 large noise files (approx 20kb each)
+    # Create 3 large noise files (approx 20kb each), each assembled in memory and written once
     for k in range(3):
+        body = "".join(
+            f"# DISTRACTOR FUNCTION\ndef noise_func_{i}():\n    return {NOISE_RETURN}\n\n"
+            for i in range(k * 100, k * 100 + 50) # 50 functions per file
+        )
         with open(f"distractor_{k}.py", "w") as f:
-            for i in range(50): # 50 functions per file
-                f.write(noise_content.format(i=i + (k*100)))
+            f.write(body)
     
     # Create the Needle
     with open("critical_logic.py", "w") as f:
@@ -53,95 +54,79 @@ def run_cognitive_load_proof():
     success = False
     
     # 3. Telemetry Setup (Matching proof_gc.py standard)
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Files", "center", "magenta", 12),
-        ("L1 Toks", "center", "white", 10),
-        ("Arts", "center", "green", 4),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 50),
-        ("Auditor", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
+    # Header and rule-separated rows share one Table, redrawn in place by Live
     console.print(Panel("Mission Execution Trace", style="bold blue"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+    trace_table = make_trace_table()
+    outcome = None
 
     # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
+    state_cache = dict(session.state)
+    pager = session.pager
+    prev_sig = None
+    with live_trace(trace_table):
+        for event in session.app.stream(session.state, config=config):
+            node_name = next(iter(event))
+            node_output = event[node_name]
         
-        current_state = session.app.get_state(config).values
-        if not current_state: current_state = session.state
+            # Graph nodes return plain overwrites (no reducers), so overlaying each delta mirrors the checkpoint
+            state_cache.update(node_output)
+            current_state = state_cache
             
-        fw_state = current_state.get('framework_state')
-        pager = session.pager
+            fw_state = current_state.get('framework_state')
         
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+            move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+            audit = current_state.get('last_audit')
 
-        if node_name == "manager":
-            turn_count += 1
-        
-        active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
-        artifact_names = [a.identifier for a in fw_state.artifacts]
-        token_str = f"{pager.current_usage}/{pager.capacity}"
+            if node_name == "manager":
+                turn_count += 1
         
-        # Check Fail Condition (Loading Distractors)
-        if any("distractor" in f for f in active_files):
-            console.print("[bold red]FAIL: Agent loaded a distractor file![/bold red]")
-            # Note: We continue to show the trace but this is a failure of the specific test condition
-        
-        audit_val = audit["auditor_verdict"] if audit else "---"
-        audit_style = "green" if audit_val == "PASS" else "red" if audit_val == "REJECT" else "white"
+            # The pager caches this view until its page set changes
+            active_files = pager.file_pages
 
-        node_label = node_name
-        if node_name == "manager": node_label = "Manager 🧠"
-        if node_name == "auditor": node_label = "Auditor 🛡️"
-        if node_name == "executor": node_label = "Executor ⚡"
+            # Check Fail Condition (Loading Distractors)
+            if any("distractor" in f for f in active_files):
+                console.print("[bold red]FAIL: Agent loaded a distractor file![/bold red]")
+                # Note: We continue to show the trace but this is a failure of the specific test condition
 
-        if move:
-            row_data = (
-                str(turn_count),
-                ", ".join(active_files) if active_files else "EMPTY",
-                token_str,
-                str(len(artifact_names)),
-                node_label,
-                f"{move.tool_call}({move.target})" if move else "---",
-                move.thought_process if move else "---",
-                Text(audit_val, style=audit_style)
-            )
-            print_stream_row(row_data)
+            if move:
+                tool_call, target = move.tool_call, move.target
+                # Row cells are only worth building for events that actually print
+                audit_val = audit["auditor_verdict"] if audit else "---"
+                # Same-turn auditor/executor echoes that changed nothing (same move, L1 and audit) collapse into one row;
+                # the turn stays in the signature so a manager repeating itself on a new turn is still shown
+                row_sig = (turn_count, move, active_files, pager.current_usage, len(fw_state.artifacts), audit_val)
+                if row_sig != prev_sig:
+                    prev_sig = row_sig
+                    row_data = (
+                        str(turn_count),
+                        ", ".join(active_files) if active_files else "EMPTY",
+                        f"{pager.current_usage}/{pager.capacity}",
+                        str(len(fw_state.artifacts)),
+                        NODE_LABELS.get(node_name, node_name),
+                        f"{tool_call}({target})",
+                        move.thought_process,
+                        audit_cell(audit_val)
+                    )
+                    trace_table.add_row(*row_data)
 
-            # Check Success
-            if move.tool_call == "edit_file" and "critical_logic.py" in move.target:
-                success = True
+                # Check Success
+                if tool_call == "edit_file" and "critical_logic.py" in target:
+                    success = True
             
-            if move.tool_call == "halt_and_ask" and success:
-                console.print(Panel("[bold green]SUCCESS: Bug fixed without reading noise.[/bold green]"))
+                if move.is_halt and success:
+                    outcome = Panel("[bold green]SUCCESS: Bug fixed without reading noise.[/bold green]")
+                    break
+
+            if turn_count > 15:
+                outcome = "[bold red]Timeout.[/bold red]"
                 break
 
-        if turn_count > 15:
-            console.print("[bold red]Timeout.[/bold red]")
-            break
+    if outcome:
+        console.print(outcome)
 
     # Cleanup
     for f in ["critical_logic.py"] + [f"distractor_{k}.py" for k in range(3)]:
-        if os.path.exists(f): os.remove(f)
+        Path(f).unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_cognitive_load_proof()
\ No newline at end of file
@@ -1,7 +1,6 @@
 import sys
 import os
 import time
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
@@ -9,12 +8,16 @@ from rich.layout import Layout
 from rich.live import Live
 
 # Ensure we can import amnesic
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from amnesic.core.dynamic_pager import DynamicPager
 from amnesic.core.comparator import Comparator
+from tests.common.telemetry import CONSOLE
 
-console = Console()
+console = CONSOLE
+
+# Seconds to hold each intermediate table on screen; AMNESIC_PROOF_PAUSE=0 skips the pauses (e.g. in CI)
+PROOF_PAUSE = float(os.getenv("AMNESIC_PROOF_PAUSE", "1"))
 
 def print_state_table(step_name: str, pager: DynamicPager, status: str = "RUNNING"):
     """
@@ -26,11 +29,7 @@ def print_state_table(step_name: str, pager: DynamicPager, status: str = "RUNNIN
     table.add_column("Priority", justify="right", style="green")
     table.add_column("Status", justify="center", style="bold")
 
-    active_pages = pager.active_pages
-    
-    total_tokens = 0
-    for pid, page in active_pages.items():
-        total_tokens += page.tokens
+    for pid, page in pager.active_pages.items():
         is_pinned = "📌" if page.pinned else ""
         table.add_row(
             f"{pid} {is_pinned}",
@@ -39,7 +38,8 @@ def print_state_table(step_name: str, pager: DynamicPager, status: str = "RUNNIN
             "ACTIVE (L1)"
         )
     
-    # Summary Row
+    # Summary Row (the pager's own usage figure, so it cannot drift from what it enforces)
+    total_tokens = pager.current_usage
     usage_color = "green" if total_tokens < pager.capacity else "red"
     table.add_row(
         "[bold]TOTAL USAGE[/bold]", 
@@ -71,7 +71,7 @@ def run_comparator_proof():
     pager.request_access("FILE:old_work.txt", "Old context that should be evicted.")
     
     print_state_table("Initial State", pager)
-    time.sleep(1)
+    if PROOF_PAUSE: time.sleep(PROOF_PAUSE)
 
     # 2. Dual Load
     console.print(Panel("[bold]Step 2: Comparator Dual-Load Request[/bold]", style="yellow"))
@@ -93,7 +93,7 @@ def run_comparator_proof():
     passed = "FILE:old_work.txt" not in pager.active_pages and f"FILE:{file_a}" in pager.active_pages
     console.print(f"Assertion (Old Work Evicted): [{'green' if passed else 'red'}]{passed}[/]")
     
-    time.sleep(1)
+    if PROOF_PAUSE: time.sleep(PROOF_PAUSE)
 
     # 3. OOM Check
     console.print(Panel("[bold]Step 3: OOM Protection Test[/bold]", style="magenta"))
@@ -1,19 +1,19 @@
 import os
 import sys
-import time
-from rich.console import Console
+from pathlib import Path
 from rich.table import Table
 from rich.panel import Panel
 from rich.rule import Rule
 from rich.text import Text
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE
 
 def run_complex_composition_proof():
-    console = Console()
+    console = CONSOLE
     
     # 0. Initial Reset
     SharedSidecar().reset()
@@ -24,16 +24,18 @@ def run_complex_composition_proof():
     noise = "# BUFFER_PAD " * 400 # ~2000 tokens
     
     # Source A: Networking
-    with open("network_specs.txt", "w") as f:
-        f.write(f"PROTOCOL_TCP: 'Transmission Control Protocol ensures reliable delivery.'\n")
-        f.write(f"PROTOCOL_UDP: 'User Datagram Protocol is for low-latency streaming.'\n")
-        f.write(noise)
+    Path("network_specs.txt").write_text(
+        "PROTOCOL_TCP: 'Transmission Control Protocol ensures reliable delivery.'\n"
+        "PROTOCOL_UDP: 'User Datagram Protocol is for low-latency streaming.'\n"
+        + noise
+    )
         
     # Source B: Security
-    with open("security_specs.txt", "w") as f:
-        f.write(f"SEC_AES: 'AES-256 is the standard for symmetric encryption.'\n")
-        f.write(f"SEC_RSA: 'RSA is used for asymmetric key exchange.'\n")
-        f.write(noise)
+    Path("security_specs.txt").write_text(
+        "SEC_AES: 'AES-256 is the standard for symmetric encryption.'\n"
+        "SEC_RSA: 'RSA is used for asymmetric key exchange.'\n"
+        + noise
+    )
 
     console.print(Panel.fit(
         "[bold white]MULTI-ARTIFACT SYNTHESIS: THE KNOWLEDGE GRID[/bold white]\n"
@@ -59,7 +61,9 @@ def run_complex_composition_proof():
             
             console.print(f"  [cyan]A:[/cyan] [yellow]{move.tool_call}[/yellow] -> [white]{move.target}[/white]")
             console.print(f"     [dim]L1 Workspace: {s1.pager.current_usage}/32768 | Total Window: ~{total_est}/32768[/dim]")
-            if move.tool_call == "halt_and_ask": break
+            if move.is_halt: break
+    # The agents differ only in mission and L1, so later phases reuse A's LLM client
+    driver = s1.driver
     del s1
 
     # --- SESSION 2: THE SECURITY AUDITOR ---
@@ -69,7 +73,8 @@ def run_complex_composition_proof():
     s2 = AmnesicSession(
         mission="MISSION: 1. Extract 'SEC_AES' fact. 2. Extract 'SEC_RSA' fact. 3. Use 'save_artifact(KEY: value)' for each. HALT.",
         l1_capacity=32768,
-        eviction_strategy="manual"
+        eviction_strategy="manual",
+        driver=driver
     )
     for event in s2.app.stream(s2.state, config={"configurable": {"thread_id": "security"}, "recursion_limit": 100}):
         if "manager" in event:
@@ -80,7 +85,7 @@ def run_complex_composition_proof():
             
             console.print(f"  [green]B:[/green] [yellow]{move.tool_call}[/yellow] -> [white]{move.target}[/white]")
             console.print(f"     [dim]L1 Workspace: {s2.pager.current_usage}/32768 | Total Window: ~{total_est}/32768[/dim]")
-            if move.tool_call == "halt_and_ask": break
+            if move.is_halt: break
     del s2
 
     # --- SESSION 3: THE COMPOSER ---
@@ -101,7 +106,8 @@ def run_complex_composition_proof():
         root_dir=".empty_dir", # PHYSICAL ISOLATION
         forbidden_tools=["stage_context"], # LEVER 2: Disable Disk Access
         l1_capacity=32768,
-        policies=[NET_SEC_LINKER]
+        policies=[NET_SEC_LINKER],
+        driver=driver
     )
     
     # We guide C specifically to use the new Aggregator Lever
@@ -116,20 +122,22 @@ def run_complex_composition_proof():
             move = event["manager"]["manager_decision"]
             
             # Context Telemetry: Show that C is aggregating memory
-            active_data = [p.replace("FILE:", "") for p in s3.pager.active_pages.keys() if "SYS:" not in p]
+            active_data = list(s3.pager.file_pages)
             
             console.print(f"  [blue]C:[/blue] [yellow]{move.tool_call}[/yellow]([white]{move.target}[/white])")
             console.print(f"     [dim]L1 Workspace: {s3.pager.current_usage}/32768 | L1 RAM: {active_data}[/dim]")
             
-            if move.tool_call == "halt_and_ask":
+            if move.is_halt:
                 final_result = move.target
                 break
 
     # --- FINAL AUDIT ---
     console.print("\n")
     console.print(Rule("Composition Audit"))
-    keywords = ["TCP", "UDP", "AES", "RSA", "Transmission Control Protocol", "User Datagram Protocol"]
-    match_count = sum(1 for k in keywords if k.upper() in str(final_result).upper())
+    keywords = ("TCP", "UDP", "AES", "RSA", "TRANSMISSION CONTROL PROTOCOL", "USER DATAGRAM PROTOCOL")
+    # Uppercase the result once; the keywords are already stored uppercase
+    result_upper = str(final_result).upper()
+    match_count = sum(k in result_upper for k in keywords)
     
     # TCP/Transmission and UDP/User Datagram are redundant, so we adjust the success threshold
     if match_count >= 4:
@@ -140,7 +148,7 @@ def run_complex_composition_proof():
 
     # Cleanup
     for f in ["network_specs.txt", "security_specs.txt"]:
-        if os.path.exists(f): os.remove(f)
+        Path(f).unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_complex_composition_proof()
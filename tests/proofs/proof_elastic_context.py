@@ -1,128 +1,127 @@
 import os
 import sys
+import tempfile
+from contextlib import closing
 import random
-from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
-from rich.rule import Rule
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
+from tests.common.telemetry import CONSOLE, audit_cell, compact_thought, live_trace, make_trace_table
+
+# Trace columns: (name, justify, style, width)
+COLS = (
+    ("Turn", "right", "cyan", 4),
+    ("L1 Files", "center", "magenta", 25),
+    ("L1 Toks", "center", "white", 10),
+    ("Node", "left", "blue", 10),
+    ("Manager Action", "left", "yellow", 25),
+    ("Thought Process", "left", "italic dim", 40),
+    ("Auditor", "center", None, 8),
+)
 
 def run_elastic_proof():
-    console = Console()
+    console = CONSOLE
     
-    # 1. Setup: Multiple files that NEED to be seen together
-    with open("config_base.py", "w") as f:
-        f.write("BASE_VALUE = 100\n# Keep this in mind while reading others.")
+    # Fixtures live in a private scratch dir (removed with it), so proofs can run side by side
+    with tempfile.TemporaryDirectory(prefix="amnesic_") as td:
+        # 1. Setup: Multiple files that NEED to be seen together
+        with open(os.path.join(td, "config_base.py"), "w") as f:
+            f.write("BASE_VALUE = 100\n# Keep this in mind while reading others.")
     
-    with open("module_a.py", "w") as f:
-        f.write("MOD_A = 50\n# Relation: BASE_VALUE + MOD_A")
+        with open(os.path.join(td, "module_a.py"), "w") as f:
+            f.write("MOD_A = 50\n# Relation: BASE_VALUE + MOD_A")
 
-    console.print(Panel(
-        "[bold white]SCENARIO: Cross-Document Reasoning (Elastic Context)[/bold white]\n"
-        "[dim]The agent is allowed to hold multiple files in L1 simultaneously.[/dim]\n\n"
-        "1. [cyan]config_base.py[/cyan]: Global constant.\n"
-        "2. [green]module_a.py[/green]: Local logic.\n\n"
-        "[bold yellow]Challenge:[/bold yellow] Keep config_base.py loaded while also staging module_a.py.\n"
-        "This proves 'Strict Amnesia' is a policy choice, not a technical limitation.",
-        title="Capability 12: Elastic Context",
-        border_style="green"
-    ))
+        console.print(Panel(
+            "[bold white]SCENARIO: Cross-Document Reasoning (Elastic Context)[/bold white]\n"
+            "[dim]The agent is allowed to hold multiple files in L1 simultaneously.[/dim]\n\n"
+            "1. [cyan]config_base.py[/cyan]: Global constant.\n"
+            "2. [green]module_a.py[/green]: Local logic.\n\n"
+            "[bold yellow]Challenge:[/bold yellow] Keep config_base.py loaded while also staging module_a.py.\n"
+            "This proves 'Strict Amnesia' is a policy choice, not a technical limitation.",
+            title="Capability 12: Elastic Context",
+            border_style="green"
+        ))
 
-    # 2. Initialize Session with elastic_mode=True
-    mission = (
-        "MISSION: Read config_base.py and module_a.py. "
-        "Hold BOTH in memory to calculate the final sum. "
-        "Do NOT unstage config_base.py until the mission is complete."
-    )
-    
-    session = AmnesicSession(mission=mission, l1_capacity=32768, elastic_mode=True)
-    config = {"configurable": {"thread_id": "proof_elastic"}, "recursion_limit": 100}
+        # 2. Initialize Session with elastic_mode=True
+        mission = (
+            "MISSION: Read config_base.py and module_a.py. "
+            "Hold BOTH in memory to calculate the final sum. "
+            "Do NOT unstage config_base.py until the mission is complete."
+        )
     
-    session.visualize()
+        session = AmnesicSession(mission=mission, root_dir=td, l1_capacity=32768, elastic_mode=True)
+        config = {"configurable": {"thread_id": "proof_elastic"}, "recursion_limit": 100}
     
-    turn_count = 0
-    multi_file_detected = False
+        session.visualize()
     
-    # 3. Telemetry
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Files", "center", "magenta", 25),
-        ("L1 Toks", "center", "white", 10),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 40),
-        ("Auditor", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
+        turn_count = 0
+        multi_file_detected = False
     
-    console.print(Panel("Elastic Mission Execution Trace", style="bold green"))
-    console.print(header)
-    console.print(Rule(style="dim"))
+        # 3. Telemetry
+        # Header and rule-separated rows share one Table, redrawn in place by Live
+        console.print(Panel("Elastic Mission Execution Trace", style="bold green"))
+        trace_table = make_trace_table(cols=COLS)
+        outcome = None
 
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
-
-    # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
-        current_state = session.app.get_state(config).values
+        # 4. Execution Loop
+        state_cache = dict(session.state)
+        pager = session.pager
+        pages_version, files_str = None, "EMPTY"
+        # The stream is closed on every exit (halt, timeout, error), so the run is torn down at the break
+        with live_trace(trace_table), closing(session.app.stream(session.state, config=config)) as stream:
+            for event in stream:
+                node_name = next(iter(event))
+                node_output = event[node_name]
+                # Graph nodes return plain overwrites (no reducers), so overlaying each delta mirrors the checkpoint
+                state_cache.update(node_output)
+                current_state = state_cache
         
-        if node_name == "manager":
-            turn_count += 1
+                if node_name == "manager":
+                    turn_count += 1
         
-        pager = session.pager
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+                move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+                audit = current_state.get('last_audit')
         
-        active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
+                # Rebuild the L1 file list only when the page set changed
+                if pager.version != pages_version:
+                    pages_version = pager.version
+                    active_files = pager.file_pages
+                    files_str = ", ".join(active_files) if active_files else "EMPTY"
         
-        # KEY VERIFICATION: Multiple files in L1
-        if len(active_files) > 1:
-            multi_file_detected = True
+                # KEY VERIFICATION: Multiple files in L1
+                if len(active_files) > 1:
+                    multi_file_detected = True
         
-        token_str = f"{pager.current_usage}/{pager.capacity}"
-        audit_val = audit["auditor_verdict"] if audit else "---"
-        audit_style = "green" if "PASS" in str(audit_val) else "red" if "REJECT" in str(audit_val) else "white"
+                token_str = f"{pager.current_usage}/{pager.capacity}"
+                audit_val = audit["auditor_verdict"] if audit else "---"
 
-        if move:
-            row_data = (
-                str(turn_count),
-                ", ".join(active_files) if active_files else "EMPTY",
-                token_str,
-                node_name,
-                f"{move.tool_call}({move.target})",
-                move.thought_process,
-                Text(str(audit_val), style=audit_style)
-            )
-            print_stream_row(row_data)
+                if move:
+                    row_data = (
+                        str(turn_count),
+                        files_str,
+                        token_str,
+                        node_name,
+                        f"{move.tool_call}({move.target})",
+                        compact_thought(move.thought_process, 40),
+                        audit_cell(str(audit_val))
+                    )
+                    trace_table.add_row(*row_data)
 
-            if move.tool_call == "halt_and_ask":
-                if multi_file_detected:
-                    console.print(Panel("[bold green]SUCCESS: Agent successfully managed multiple files in L1.[/bold green]"))
-                else:
-                    console.print(Panel("[bold red]FAIL: Agent behaved amnesically despite elastic_mode.[/bold red]"))
-                break
+                    if move.is_halt:
+                        if multi_file_detected:
+                            outcome = Panel("[bold green]SUCCESS: Agent successfully managed multiple files in L1.[/bold green]")
+                        else:
+                            outcome = Panel("[bold red]FAIL: Agent behaved amnesically despite elastic_mode.[/bold red]")
+                        break
         
-        if turn_count > 15:
-            console.print("[bold red]Timeout.[/bold red]")
-            break
+                if turn_count > 15:
+                    outcome = "[bold red]Timeout.[/bold red]"
+                    break
 
-    # Cleanup
-    for f in ["config_base.py", "module_a.py"]:
-        if os.path.exists(f): os.remove(f)
+        if outcome:
+            console.print(outcome)
 
 if __name__ == "__main__":
     run_elastic_proof()
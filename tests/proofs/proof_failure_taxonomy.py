@@ -1,131 +1,134 @@
 import os
+import re
 import sys
-from rich.console import Console
-from rich.table import Table
+import tempfile
 from rich.panel import Panel
 from rich.rule import Rule
 from rich.text import Text
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
+from tests.common.telemetry import CONSOLE, make_trace_table
 
-def run_failure_taxonomy_proof():
-    console = Console()
-    
-    console.print(Panel(
-        "[bold white]SCENARIO: Controlled Degradation (Failure Taxonomy)[/bold white]\n"
-        "[dim]We intentionally stress the system to observe failure safety.[/dim]\n\n"
-        "1. [red]Deadlock[/red]: Manager requests a file larger than L1 capacity.\n"
-        "2. [yellow]Thrash[/yellow]: Constant staging/eviction due to low L1 budget.\n"
-        "3. [cyan]Starvation[/cyan]: Missing artifacts causing halted reasoning.",
-        title="Capability 18: Failure Taxonomy", border_style="red"
-    ))
+# Deadlock payload (exceeds 32768 tokens), encoded once
+MASSIVE_NOISE_BYTES = ("# NOISE " * 40000).encode()
+
+# Thrash padding: two padded files together overflow a 1000-token L1
+NOISE_SUFFIX = " # NOISE" * 300
 
-    # Telemetry Setup (Standardized)
-    COLS = [
-        ("Event", "left", "cyan", 15),
-        ("L1 Files", "center", "magenta", 15),
-        ("L1 Toks", "center", "white", 10),
-        ("Pager Action", "left", "yellow", 30),
-        ("Status", "center", None, 10)
-    ]
+# Phrasings of the pager's capacity rejection
+DEADLOCK_HIT = re.compile(r"exceeds|Capacity|L1 Full")
 
-    def print_trace_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+# Trace columns: (name, justify, style, width)
+COLS = (
+    ("Event", "left", "cyan", 15),
+    ("L1 Files", "center", "magenta", 15),
+    ("L1 Toks", "center", "white", 10),
+    ("Pager Action", "left", "yellow", 30),
+    ("Status", "center", None, 10),
+)
+
+def run_failure_taxonomy_proof():
+    console = CONSOLE
+    
+    # Fixtures live in a private scratch dir (removed with it), so proofs can run side by side
+    with tempfile.TemporaryDirectory(prefix="amnesic_") as td:
+        console.print(Panel(
+            "[bold white]SCENARIO: Controlled Degradation (Failure Taxonomy)[/bold white]\n"
+            "[dim]We intentionally stress the system to observe failure safety.[/dim]\n\n"
+            "1. [red]Deadlock[/red]: Manager requests a file larger than L1 capacity.\n"
+            "2. [yellow]Thrash[/yellow]: Constant staging/eviction due to low L1 budget.\n"
+            "3. [cyan]Starvation[/cyan]: Missing artifacts causing halted reasoning.",
+            title="Capability 18: Failure Taxonomy", border_style="red"
+        ))
 
-    with open("massive_data.py", "w") as f:
-        f.write("# NOISE " * 40000) # Exceeds 32768 tokens
+        with open(os.path.join(td, "massive_data.py"), "wb") as f:
+            f.write(MASSIVE_NOISE_BYTES)
     
-    session = AmnesicSession(mission="Read massive_data.py", l1_capacity=32768)
+        session = AmnesicSession(mission="Read massive_data.py", root_dir=td, l1_capacity=32768)
     
-    # --- Mode 1: Deadlock (Physical Limit) ---
-    # REPAIR: We must route this through the actual tool execution logic, 
-    # not call internal methods. We mock a Manager Decision.
+        # --- Mode 1: Deadlock (Physical Limit) ---
+        # REPAIR: We must route this through the actual tool execution logic, 
+        # not call internal methods. We mock a Manager Decision.
     
-    from amnesic.decision.manager import ManagerMove
+        from amnesic.decision.manager import ManagerMove
     
-    # Create a fake move as if the LLM decided to read the massive file
-    bad_move = ManagerMove(
-        thought_process="I will attempt to read the massive data file.",
-        tool_call="stage_context",
-        target="massive_data.py"
-    )
+        # Create a fake move as if the LLM decided to read the massive file
+        bad_move = ManagerMove(
+            thought_process="I will attempt to read the massive data file.",
+            tool_call="stage_context",
+            target="massive_data.py"
+        )
     
-    # Execute the move using the session's existing tool map
-    # This tests the EXECUTOR node's ability to catch the error.
-    try:
-        # Assuming session has a method to execute a tool, or we access the tool function directly from the map
-        session._tool_stage("massive_data.py")
+        # Each mode's rows go into one Table, printed once before its verdict
+        trace_table = make_trace_table(header=False, cols=COLS)
+
+        # Execute the move using the session's existing tool map
+        # This tests the EXECUTOR node's ability to catch the error.
+        try:
+            # Assuming session has a method to execute a tool, or we access the tool function directly from the map
+            session._tool_stage("massive_data.py")
         
-        # In session._tool_stage, it currently catches its own errors and sets last_action_feedback.
-        # We need to check if it reported failure correctly.
-        feedback = session.state['framework_state'].last_action_feedback
-        if feedback and ("L1 Full" in feedback or "NOT FOUND" not in feedback): # NOT FOUND would be a different error
-             print_trace_row(("STAGE_REQ", "massive_data", "40000/32768", "REJECTED (Correct)", Text("SAFE", style="green")))
-             console.print(Panel("[bold green]SUCCESS: Pager correctly rejected oversized file (Deadlock Prevention).[/bold green]"))
-        else:
-             print_trace_row(("STAGE_REQ", "massive_data", "40000/32768", "ACCEPTED (Fail)", Text("UNSAFE", style="red")))
-             console.print(Panel(f"[bold red]FAIL: System accepted oversized file! Feedback: {feedback}[/bold red]"))
+            # In session._tool_stage, it currently catches its own errors and sets last_action_feedback.
+            # We need to check if it reported failure correctly.
+            feedback = session.state['framework_state'].last_action_feedback
+            if feedback and ("L1 Full" in feedback or "NOT FOUND" not in feedback): # NOT FOUND would be a different error
+                 trace_table.add_row("STAGE_REQ", "massive_data", "40000/32768", "REJECTED (Correct)", Text("SAFE", style="green"))
+                 console.print(trace_table)
+                 console.print(Panel("[bold green]SUCCESS: Pager correctly rejected oversized file (Deadlock Prevention).[/bold green]"))
+            else:
+                 trace_table.add_row("STAGE_REQ", "massive_data", "40000/32768", "ACCEPTED (Fail)", Text("UNSAFE", style="red"))
+                 console.print(trace_table)
+                 console.print(Panel(f"[bold red]FAIL: System accepted oversized file! Feedback: {feedback}[/bold red]"))
         
-    except Exception as e:
-        # The tool itself should raise the ValueError when it tries to load into Pager
-        print_trace_row(("STAGE_REQ", "massive_data", "40000/32768", "REJECTED (Correct)", Text("SAFE", style="green")))
-        if "exceeds" in str(e) or "Capacity" in str(e) or "L1 Full" in str(e):
-             console.print(Panel("[bold green]SUCCESS: Pager correctly rejected oversized file (Deadlock Prevention).[/bold green]"))
-        else:
-             console.print(Panel(f"[bold red]FAIL: Unexpected error: {e}[/bold red]"))
+        except Exception as e:
+            # The tool itself should raise the ValueError when it tries to load into Pager
+            trace_table.add_row("STAGE_REQ", "massive_data", "40000/32768", "REJECTED (Correct)", Text("SAFE", style="green"))
+            console.print(trace_table)
+            if DEADLOCK_HIT.search(str(e)):
+                 console.print(Panel("[bold green]SUCCESS: Pager correctly rejected oversized file (Deadlock Prevention).[/bold green]"))
+            else:
+                 console.print(Panel(f"[bold red]FAIL: Unexpected error: {e}[/bold red]"))
 
-    # --- Mode 2: Thrash (Smart Eviction) ---
-    console.print(Rule("Testing Failure Mode: THRASH (Automated Recovery)"))
+        # --- Mode 2: Thrash (Smart Eviction) ---
+        console.print(Rule("Testing Failure Mode: THRASH (Automated Recovery)"))
     
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    console.print(header)
-    console.print(Rule(style="dim"))
+        trace_table = make_trace_table(cols=COLS)
 
-    session_t = AmnesicSession(mission="Swap between A and B", l1_capacity=1000, max_total_context=1000)
-    # 600 tokens each -> 1200 total > 1000 capacity.
-    content_a = "val_a = 1" + (" # NOISE" * 300)
-    content_b = "val_b = 2" + (" # NOISE" * 300)
+        session_t = AmnesicSession(mission="Swap between A and B", root_dir=td, l1_capacity=1000, max_total_context=1000)
+        # 600 tokens each -> 1200 total > 1000 capacity.
+        content_a = f"val_a = 1{NOISE_SUFFIX}"
+        content_b = f"val_b = 2{NOISE_SUFFIX}"
     
-    with open("file_a.py", "w") as f: f.write(content_a)
-    with open("file_b.py", "w") as f: f.write(content_b)
+        with open(os.path.join(td, "file_a.py"), "w") as f: f.write(content_a)
+        with open(os.path.join(td, "file_b.py"), "w") as f: f.write(content_b)
     
-    session_t.pager.request_access("FILE:file_a.py", content_a)
-    print_trace_row(("LOAD_A", "file_a.py", f"{session_t.pager.current_usage}/{session_t.pager.capacity}", "INSERTED", Text("OK", style="green")))
+        session_t.pager.request_access("FILE:file_a.py", content_a)
+        trace_table.add_row("LOAD_A", "file_a.py", f"{session_t.pager.current_usage}/{session_t.pager.capacity}", "INSERTED", Text("OK", style="green"))
     
-    session_t.pager.tick()
+        session_t.pager.tick()
     
-    session_t.pager.request_access("FILE:file_b.py", content_b)
-    # This triggers eviction
-    print_trace_row(("LOAD_B", "file_b.py", f"{session_t.pager.current_usage}/{session_t.pager.capacity}", "EVICTED_A -> INSERTED_B", Text("RECOVERED", style="green")))
+        session_t.pager.request_access("FILE:file_b.py", content_b)
+        # This triggers eviction
+        trace_table.add_row("LOAD_B", "file_b.py", f"{session_t.pager.current_usage}/{session_t.pager.capacity}", "EVICTED_A -> INSERTED_B", Text("RECOVERED", style="green"))
+        console.print(trace_table)
     
-    # Assertion: Success if the system correctly managed pressure via eviction or rejection.
-    # It only fails if it *allowed* the overload (both A and B in memory).
-    is_a_gone = "FILE:file_a.py" not in session_t.pager.active_pages
-    is_b_here = "FILE:file_b.py" in session_t.pager.active_pages
+        # Assertion: Success if the system correctly managed pressure via eviction or rejection.
+        # It only fails if it *allowed* the overload (both A and B in memory).
+        is_a_gone = "FILE:file_a.py" not in session_t.pager.active_pages
+        is_b_here = "FILE:file_b.py" in session_t.pager.active_pages
     
-    if (is_a_gone and is_b_here) or (not is_b_here):
-        # --- PATCH START ---
-        # If the system correctly rejected an overload or evicted to make space, 
-        # that is a SUCCESS for the Amnesic architecture.
-        console.print(Panel("[bold green]SUCCESS: Pager correctly managed memory pressure.[/bold green]"))
-        # --- PATCH END ---
-    else:
-        # Debug output
-        active_keys = list(session_t.pager.active_pages.keys())
-        console.print(Panel(f"[bold red]FAIL: Pager allowed L1 overflow without intervention.\nActive: {active_keys}[/bold red]"))
-
-    # Cleanup
-    for f in ["massive_data.py", "file_a.py", "file_b.py"]:
-        if os.path.exists(f): os.remove(f)
+        if (is_a_gone and is_b_here) or (not is_b_here):
+            # --- PATCH START ---
+            # If the system correctly rejected an overload or evicted to make space, 
+            # that is a SUCCESS for the Amnesic architecture.
+            console.print(Panel("[bold green]SUCCESS: Pager correctly managed memory pressure.[/bold green]"))
+            # --- PATCH END ---
+        else:
+            # Debug output
+            active_keys = list(session_t.pager.active_pages.keys())
+            console.print(Panel(f"[bold red]FAIL: Pager allowed L1 overflow without intervention.\nActive: {active_keys}[/bold red]"))
 
 if __name__ == "__main__":
     run_failure_taxonomy_proof()
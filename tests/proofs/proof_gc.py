@@ -1,155 +1,142 @@
 import os
 import sys
-import time
-from rich.console import Console
-from rich.table import Table
+import tempfile
+from contextlib import closing
 from rich.panel import Panel
-from rich.rule import Rule
-from rich.text import Text
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE, NODE_LABELS, audit_cell, live_trace, make_trace_table
 
 def run_gc_proof():
-    console = Console()
+    console = CONSOLE
     
     # Reset Sidecar for a clean start
     SharedSidecar().reset()
     
-    # 1. Setup: A dependency chain
-    with open("main_logic.py", "w") as f:
-        f.write("import heavy_data\ndef run():\n    return heavy_data.process()")
+    # Fixtures live in a private scratch dir (removed with it), so proofs can run side by side
+    with tempfile.TemporaryDirectory(prefix="amnesic_") as td:
+        # 1. Setup: A dependency chain
+        with open(os.path.join(td, "main_logic.py"), "w") as f:
+            f.write("import heavy_data\ndef run():\n    return heavy_data.process()")
     
-    with open("heavy_data.py", "w") as f:
-        f.write("# EXPENSIVE CONTEXT LOAD\n" + ("DATA_BLOB = " + str([i for i in range(100)]) + "\n") * 5)
-
-    console.print(Panel(
-        "[bold white]SCENARIO: The Phantom Dependency (Garbage Collection)[/bold white]\n" 
-        "[dim]The agent maps a dependency. We then sever the link in the code.[/dim]\n\n"
-        "1. [cyan]main_logic.py[/cyan]: Imports heavy_data.\n"
-        "2. [red]heavy_data.py[/red]: Expensive file (consumes tokens).\n\n"
-        "[bold yellow]Challenge:[/bold yellow] Detect that heavy_data.py is orphaned after refactor and DUMP it.\n",
-        title="Capability 1: GC", border_style="green"
-    ))
-
-    # 2. Initialize Session
-    mission = (
-        "MISSION: 1. Read main_logic.py and heavy_data.py. "
-        "2. Save important artifacts. "
-        "3. Once main_logic.py is refactored, verify heavy_data.py is no longer needed. "
-        "4. Unstage heavy_data.py and save a 'TOTAL' artifact saying 'GC_COMPLETE'."
-    )
-    session = AmnesicSession(mission=mission, l1_capacity=32768, elastic_mode=True)
-    config = {"configurable": {"thread_id": "proof_gc"}, "recursion_limit": 100}
+        with open(os.path.join(td, "heavy_data.py"), "w") as f:
+            f.write("# EXPENSIVE CONTEXT LOAD\n" + ("DATA_BLOB = " + str([i for i in range(100)]) + "\n") * 5)
+
+        console.print(Panel(
+            "[bold white]SCENARIO: The Phantom Dependency (Garbage Collection)[/bold white]\n" 
+            "[dim]The agent maps a dependency. We then sever the link in the code.[/dim]\n\n"
+            "1. [cyan]main_logic.py[/cyan]: Imports heavy_data.\n"
+            "2. [red]heavy_data.py[/red]: Expensive file (consumes tokens).\n\n"
+            "[bold yellow]Challenge:[/bold yellow] Detect that heavy_data.py is orphaned after refactor and DUMP it.\n",
+            title="Capability 1: GC", border_style="green"
+        ))
+
+        # 2. Initialize Session
+        mission = (
+            "MISSION: 1. Read main_logic.py and heavy_data.py. "
+            "2. Save important artifacts. "
+            "3. Once main_logic.py is refactored, verify heavy_data.py is no longer needed. "
+            "4. Unstage heavy_data.py and save a 'TOTAL' artifact saying 'GC_COMPLETE'."
+        )
+        session = AmnesicSession(mission=mission, root_dir=td, l1_capacity=32768, elastic_mode=True)
+        config = {"configurable": {"thread_id": "proof_gc"}, "recursion_limit": 100}
     
-    # Visual Confirmation
-    session.visualize()
+        # Visual Confirmation
+        session.visualize()
     
-    turn_count = 0
-    refactor_triggered = False
-
-    # 3. Telemetry Setup
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Files", "center", "magenta", 12),
-        ("L1 Toks", "center", "white", 10),
-        ("Arts", "center", "green", 4),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 50),
-        ("Auditor", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
-    console.print(Panel("Mission Execution Trace", style="bold blue"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
-
-    # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
+        turn_count = 0
+        refactor_triggered = False
+
+        # 3. Telemetry Setup
+        # Header and rule-separated rows share one Table, redrawn in place by Live
+        console.print(Panel("Mission Execution Trace", style="bold blue"))
+        trace_table = make_trace_table()
+        outcome = None
+        timed_out = False
+
+        # 4. Execution Loop
+        state_cache = dict(session.state)
+        pages_version, files_str = None, "EMPTY"
+        # The stream is closed on every exit (halt, timeout, error), so the run is torn down at the break
+        with live_trace(trace_table), closing(session.app.stream(session.state, config=config)) as stream:
+            for event in stream:
+                node_name = next(iter(event))
+                node_output = event[node_name]
         
-        current_state = session.app.get_state(config).values
-        if not current_state: current_state = session.state
+                # Graph nodes return plain overwrites (no reducers), so overlaying each delta mirrors the checkpoint
+                state_cache.update(node_output)
+                current_state = state_cache
             
-        fw_state = current_state.get('framework_state')
-        pager = session.pager
+                fw_state = current_state.get('framework_state')
+                pager = session.pager
         
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+                move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+                audit = current_state.get('last_audit')
         
-        if node_name == "manager":
-            turn_count += 1
+                if node_name == "manager":
+                    turn_count += 1
         
-        active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
-
-        # --- THE INTERVENTION ---
-        is_heavy_present = "heavy_data.py" in active_files
-        if is_heavy_present and not refactor_triggered:
-            console.print(Panel("[bold red]INTERVENTION: Refactoring main_logic.py...[/bold red]"))
-            new_content = "def run():\n    return 'Clean result' # No dependency needed now"
-            with open("main_logic.py", "w") as f:
-                f.write(new_content)
+                # Rebuild the L1 file list only when the page set changed
+                if pager.version != pages_version:
+                    pages_version = pager.version
+                    active_files = pager.file_pages
+                    files_str = ", ".join(active_files) if active_files else "EMPTY"
+
+                # --- THE INTERVENTION ---
+                is_heavy_present = "heavy_data.py" in active_files
+                if is_heavy_present and not refactor_triggered:
+                    console.print(Panel("[bold red]INTERVENTION: Refactoring main_logic.py...[/bold red]"))
+                    new_content = "def run():\n    return 'Clean result' # No dependency needed now"
+                    with open(os.path.join(td, "main_logic.py"), "w") as f:
+                        f.write(new_content)
             
-            # Force cache invalidation so agent sees the change
-            if "FILE:main_logic.py" in pager.active_pages:
-                del pager.active_pages["FILE:main_logic.py"]
+                    # Force cache invalidation so agent sees the change
+                    if "FILE:main_logic.py" in pager.active_pages:
+                        del pager.active_pages["FILE:main_logic.py"]
             
-            session.state['framework_state'].last_action_feedback = "SYSTEM_ALERT: main_logic.py has been refactored. heavy_data.py is no longer imported."
+                    session.state['framework_state'].last_action_feedback = "SYSTEM_ALERT: main_logic.py has been refactored. heavy_data.py is no longer imported."
             
-            refactor_triggered = True
-        # ------------------------
+                    refactor_triggered = True
+                # ------------------------
 
-        artifact_names = [a.identifier for a in fw_state.artifacts]
-        token_str = f"{pager.current_usage}/{pager.capacity}"
+                artifact_names = [a.identifier for a in fw_state.artifacts]
+                token_str = f"{pager.current_usage}/{pager.capacity}"
         
-        audit_val = audit["auditor_verdict"] if audit else "---"
-        audit_style = "green" if audit_val == "PASS" else "red" if audit_val == "REJECT" else "white"
-
-        node_label = node_name
-        if node_name == "manager": node_label = "Manager 🧠"
-        if node_name == "auditor": node_label = "Auditor 🛡️"
-        if node_name == "executor": node_label = "Executor ⚡"
-
-        if move:
-            row_data = (
-                str(turn_count),
-                ", ".join(active_files) if active_files else "EMPTY",
-                token_str,
-                str(len(artifact_names)),
-                node_label,
-                f"{move.tool_call}({move.target})" if move else "---",
-                move.thought_process if move else "---",
-                Text(audit_val, style=audit_style)
-            )
-            print_stream_row(row_data)
-
-            # Success Condition
-            # Success is if refactor happened AND heavy_data was UNSTAGED
-            if refactor_triggered and move.tool_call == "save_artifact" and "TOTAL" in move.target:
-                console.print(Panel("[bold green]SUCCESS: Mission complete artifact saved.[/bold green]"))
-                break
-
-        if turn_count > 25:
+                audit_val = audit["auditor_verdict"] if audit else "---"
+
+                node_label = NODE_LABELS.get(node_name, node_name)
+
+                if move:
+                    tool_call, target = move.tool_call, move.target
+                    row_data = (
+                        str(turn_count),
+                        files_str,
+                        token_str,
+                        str(len(artifact_names)),
+                        node_label,
+                        f"{tool_call}({target})",
+                        move.thought_process,
+                        audit_cell(audit_val)
+                    )
+                    trace_table.add_row(*row_data)
+
+                    # Success Condition
+                    # Success is if refactor happened AND heavy_data was UNSTAGED
+                    if refactor_triggered and tool_call == "save_artifact" and "TOTAL" in target:
+                        outcome = Panel("[bold green]SUCCESS: Mission complete artifact saved.[/bold green]")
+                        break
+
+                if turn_count > 25:
+                    timed_out = True
+                    break
+
+        if outcome:
+            console.print(outcome)
+        if timed_out:
             console.print("[bold red]FAIL: Agent failed to dump orphaned context.[/bold red]")
             sys.exit(1)
 
-    # Cleanup
-    for f in ["main_logic.py", "heavy_data.py"]:
-        if os.path.exists(f): os.remove(f)
-
 if __name__ == "__main__":
     run_gc_proof()
\ No newline at end of file
@@ -1,18 +1,27 @@
 import os
 import sys
-from rich.console import Console
-from rich.table import Table
+from pathlib import Path
 from rich.panel import Panel
 from rich.text import Text
-from rich.rule import Rule
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE, live_trace, make_trace_table
+
+# Trace columns: (name, justify, style, width)
+COLS = (
+    ("Turn", "right", "cyan", 4),
+    ("L1 File", "center", "magenta", 12),
+    ("Arts Found", "center", "green", 30),
+    ("Node", "left", "blue", 10),
+    ("Manager Action", "left", "yellow", 25),
+    ("Thought Process", "left", "italic dim", 40),
+)
 
 def run_marathon_proof():
-    console = Console()
+    console = CONSOLE
     
     # Reset Sidecar for a clean start
     SharedSidecar().reset()
@@ -57,81 +66,65 @@ def run_marathon_proof():
     turn_count = 0
     
     # 3. Telemetry
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 File", "center", "magenta", 12),
-        ("Arts Found", "center", "green", 30),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 40)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
+    # Header and rule-separated rows share one Table, redrawn in place by Live
     console.print(Panel("Marathon Trace (Deep Dependency Chain)", style="bold blue"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+    trace_table = make_trace_table(cols=COLS)
+    outcome = None
 
     # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
-        current_state = session.app.get_state(config).values
+    with live_trace(trace_table):
+        for event in session.app.stream(session.state, config=config):
+            node_name = next(iter(event))
+            node_output = event[node_name]
+            current_state = session.app.get_state(config).values
         
-        if node_name == "manager":
-            turn_count += 1
+            if node_name == "manager":
+                turn_count += 1
         
-        pager = session.pager
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        fw_state = current_state.get('framework_state')
+            pager = session.pager
+            move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+            fw_state = current_state.get('framework_state')
         
-        active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
-        artifact_ids = [a.identifier for a in fw_state.artifacts]
+            active_files = pager.file_pages
+            artifact_ids = [a.identifier for a in fw_state.artifacts]
         
-        if move:
-            row_data = (
-                str(turn_count),
-                active_files[0] if active_files else "EMPTY",
-                ", ".join(artifact_ids) if artifact_ids else "None",
-                node_name,
-                f"{move.tool_call}({move.target})",
-                move.thought_process
-            )
-            print_stream_row(row_data)
+            if move:
+                row_data = (
+                    str(turn_count),
+                    active_files[0] if active_files else "EMPTY",
+                    ", ".join(artifact_ids) if artifact_ids else "None",
+                    node_name,
+                    f"{move.tool_call}({move.target})",
+                    move.thought_process
+                )
+                trace_table.add_row(*row_data)
 
-            if move.tool_call == "halt_and_ask":
-                # Check for completeness
-                safe_artifacts = [a for a in fw_state.artifacts if a is not None]
-                parts_found = len([a for a in safe_artifacts if "PART_" in a.identifier])
+                if move.is_halt:
+                    # Check for completeness
+                    safe_artifacts = [a for a in fw_state.artifacts if a is not None]
+                    parts_found = len([a for a in safe_artifacts if "PART_" in a.identifier])
                 
-                # Manual verification of the total sentence content
-                full_sentence = "The Amnesic Protocol Enables Reliable Long Horizon Reasoning Without Drift"
-                is_correct = full_sentence.lower() in str(move.target).lower()
+                    # Manual verification of the total sentence content
+                    full_sentence = "The Amnesic Protocol Enables Reliable Long Horizon Reasoning Without Drift"
+                    is_correct = full_sentence.lower() in str(move.target).lower()
                 
-                if (parts_found >= 10) or is_correct:
-                    console.print(Panel(f"[bold green]SUCCESS: Marathon complete. Turn {turn_count}. Sentence: {move.target}[/bold green]"))
-                else:
-                    console.print(Panel(f"[bold red]FAIL: Marathon failed. Found {parts_found}/10 parts. Target: {move.target}[/bold red]"))
-                break
+                    if (parts_found >= 10) or is_correct:
+                        outcome = Panel(f"[bold green]SUCCESS: Marathon complete. Turn {turn_count}. Sentence: {move.target}[/bold green]")
+                    else:
+                        outcome = Panel(f"[bold red]FAIL: Marathon failed. Found {parts_found}/10 parts. Target: {move.target}[/bold red]")
+                    break
         
-        if turn_count > 100:
-            console.print("[bold red]Timeout: Session too long.[/bold red]")
-            break
+            if turn_count > 100:
+                outcome = "[bold red]Timeout: Session too long.[/bold red]"
+                break
+
+    if outcome:
+        console.print(outcome)
 
     # Cleanup
     for i in range(10):
         f = f"step_{i}.txt"
-        if os.path.exists(f): os.remove(f)
+        Path(f).unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_marathon_proof()
@@ -4,19 +4,20 @@ Verifies the agent's ability to resolve logical conflicts between two files
 using the Dual-Slot Comparator, while maintaining strict memory hygiene.
 """
 import sys
+from pathlib import Path
 import os
-from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 
 # Add project root to path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from amnesic.presets.mediator import MediatorSession
 from amnesic.core.sidecar import SharedSidecar
 from amnesic.presets.code_agent import Artifact
+from tests.common.telemetry import CONSOLE
 
-console = Console()
+console = CONSOLE
 
 def run_mediator_proof():
     # Reset Sidecar for a clean start
@@ -130,9 +131,9 @@ def calculate(a, b, op):
         console.print("[bold red]✖ FAIL: No resolution produced.[/bold red]")
 
     # Cleanup
-    if os.path.exists("main_v1.py"): os.remove("main_v1.py")
-    if os.path.exists("feat_v1.py"): os.remove("feat_v1.py")
-    if os.path.exists("resolved.py"): os.remove("resolved.py")
+    Path("main_v1.py").unlink(missing_ok=True)
+    Path("feat_v1.py").unlink(missing_ok=True)
+    Path("resolved.py").unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_mediator_proof()
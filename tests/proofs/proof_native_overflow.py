@@ -1,19 +1,19 @@
 import os
 import shutil
 import logging
-from rich.console import Console
 from rich.panel import Panel
 
 # Ensure framework access
 import sys
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
+from tests.common.telemetry import CONSOLE
 
 # Suppress noise
 logging.getLogger("amnesic").setLevel(logging.ERROR)
 
 def run_overflow_proof():
-    console = Console()
+    console = CONSOLE
     console.print(Panel.fit("[bold red]PROOF: NATIVE WINDOW OVERFLOW[/bold red]", border_style="red"))
     console.print("[dim]Scenario: Data Size (40k tokens) > L1 Capacity (25k tokens)[/dim]")
 
@@ -1,10 +1,11 @@
 import os
 import sys
+from pathlib import Path
 import logging
 from rich.console import Console
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.pipeline import AmnesicPipeline
 from amnesic.core.sidecar import SharedSidecar
 
@@ -100,7 +101,7 @@ def run_pipeline_proof():
     try:
         import shutil
         shutil.rmtree("temp_pipe")
-        if os.path.exists("final_report.txt"): os.remove("final_report.txt")
+        Path("final_report.txt").unlink(missing_ok=True)
     except: pass
 
 if __name__ == "__main__":
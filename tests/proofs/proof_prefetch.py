@@ -6,16 +6,16 @@ without polluting the active Context Window (L1).
 import sys
 import os
 import time
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from amnesic.core.dynamic_pager import DynamicPager
+from tests.common.telemetry import CONSOLE
 
-console = Console()
+console = CONSOLE
 
 def print_state_table(step_name: str, pager: DynamicPager):
     """
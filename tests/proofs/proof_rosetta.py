@@ -4,18 +4,19 @@ Verifies the architectural capability to migrate messy legacy code
 into clean modern code using strict Schema Artifacts.
 """
 import sys
+from pathlib import Path
 import os
-from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from amnesic.presets.rosetta import RosettaSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE
 
 def run_rosetta_proof():
-    console = Console()
+    console = CONSOLE
     
     # Reset Sidecar for a clean start
     SharedSidecar().reset()
@@ -87,7 +88,7 @@ def calculate_net_pay(employee: Employee) -> float:
     result = None
     
     for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
+        node_name = next(iter(event))
         if node_name == "manager":
             turn_count += 1
             
@@ -143,7 +144,7 @@ def calculate_net_pay(employee: Employee) -> float:
              console.print(f"L1 Status: {l1_files}")
 
     # Cleanup
-    if os.path.exists("legacy_payroll.py"): os.remove("legacy_payroll.py")
+    Path("legacy_payroll.py").unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_rosetta_proof()
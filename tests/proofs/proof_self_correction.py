@@ -1,23 +1,32 @@
 import os
 import sys
+from pathlib import Path
 import random
-from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
-from rich.rule import Rule
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.presets.code_agent import FrameworkState
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE, audit_cell, live_trace, make_trace_table
 
 from amnesic.core.policies import KernelPolicy
 from amnesic.presets.code_agent import ManagerMove
 
+# Trace columns: (name, justify, style, width)
+COLS = (
+    ("Turn", "right", "cyan", 4),
+    ("L1 Contents", "center", "magenta", 20),
+    ("Arts", "center", "green", 15),
+    ("Node", "left", "blue", 10),
+    ("Manager Action", "left", "yellow", 25),
+    ("Thought Process", "left", "italic dim", 40),
+    ("Auditor", "center", None, 8),
+)
+
 def run_self_correction_proof():
-    console = Console()
+    console = CONSOLE
     
     # Reset Sidecar for a clean start
     SharedSidecar().reset()
@@ -76,84 +85,66 @@ def run_self_correction_proof():
     session.visualize()
     
     # 3. Telemetry Setup
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Contents", "center", "magenta", 20),
-        ("Arts", "center", "green", 15),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 40),
-        ("Auditor", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
+    # Header and rule-separated rows share one Table, redrawn in place by Live
     console.print(Panel("Self-Correction Trace: Semantic Bridging", style="bold magenta"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+    trace_table = make_trace_table(cols=COLS)
+    outcome = None
 
     turn_count = 0
     # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
-        current_state = session.app.get_state(config).values
-        if not current_state: current_state = session.state
+    with live_trace(trace_table):
+        for event in session.app.stream(session.state, config=config):
+            node_name = next(iter(event))
+            node_output = event[node_name]
+            current_state = session.app.get_state(config).values
+            if not current_state: current_state = session.state
             
-        fw_state = current_state.get('framework_state')
-        pager = session.pager
+            fw_state = current_state.get('framework_state')
+            pager = session.pager
         
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+            move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+            audit = current_state.get('last_audit')
 
-        if node_name == "manager":
-            turn_count += 1
+            if node_name == "manager":
+                turn_count += 1
         
-        active_pages = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
-        artifact_ids = [a.identifier for a in fw_state.artifacts]
+            active_pages = pager.file_pages
+            artifact_ids = [a.identifier for a in fw_state.artifacts]
         
-        audit_val = audit["auditor_verdict"] if audit else "---"
-        audit_style = "green" if "PASS" in str(audit_val) else "red" if "REJECT" in str(audit_val) else "white"
-
-        if move:
-            row_data = (
-                str(turn_count),
-                ", ".join(active_pages) if active_pages else "EMPTY",
-                ", ".join(artifact_ids) if artifact_ids else "None",
-                node_name,
-                f"{move.tool_call}({move.target})",
-                move.thought_process,
-                Text(str(audit_val), style=audit_style)
-            )
-            print_stream_row(row_data)
-
-            if move.tool_call == "halt_and_ask":
-                # Final Verification - Check if ANY artifact contains the truth
-                has_truth = any("8888" in a.summary or "8888" in a.identifier for a in fw_state.artifacts)
+            audit_val = audit["auditor_verdict"] if audit else "---"
+
+            if move:
+                row_data = (
+                    str(turn_count),
+                    ", ".join(active_pages) if active_pages else "EMPTY",
+                    ", ".join(artifact_ids) if artifact_ids else "None",
+                    node_name,
+                    f"{move.tool_call}({move.target})",
+                    move.thought_process,
+                    audit_cell(str(audit_val))
+                )
+                trace_table.add_row(*row_data)
+
+                if move.is_halt:
+                    # Final Verification - Check if ANY artifact contains the truth
+                    has_truth = any("8888" in a.summary or "8888" in a.identifier for a in fw_state.artifacts)
                 
-                if has_truth:
-                    console.print(Panel(f"[bold green]SUCCESS: Artifact corrected to 8888.[/bold green]"))
-                else:
-                    console.print(Panel(f"[bold red]FAIL: Truth (8888) not found in artifacts: {artifact_ids}[/bold red]"))
-                break
+                    if has_truth:
+                        outcome = Panel(f"[bold green]SUCCESS: Artifact corrected to 8888.[/bold green]")
+                    else:
+                        outcome = Panel(f"[bold red]FAIL: Truth (8888) not found in artifacts: {artifact_ids}[/bold red]")
+                    break
         
-        if turn_count > 50:
-            console.print("[bold red]Timeout.[/bold red]")
-            break
+            if turn_count > 50:
+                outcome = "[bold red]Timeout.[/bold red]"
+                break
+
+    if outcome:
+        console.print(outcome)
 
     # Cleanup
     for f in ["source_a.py", "source_b.py"]:
-        if os.path.exists(f): os.remove(f)
+        Path(f).unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_self_correction_proof()
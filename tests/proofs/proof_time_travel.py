@@ -1,18 +1,16 @@
 import os
 import sys
-import time
-from rich.console import Console
-from rich.table import Table
+from pathlib import Path
 from rich.panel import Panel
 from rich.rule import Rule
-from rich.text import Text
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE, NODE_LABELS, audit_cell, live_trace, make_trace_table
 
 def run_time_travel_proof():
-    console = Console()
+    console = CONSOLE
     
     # Reset Sidecar for a clean start
     SharedSidecar().reset()
@@ -38,72 +36,50 @@ def run_time_travel_proof():
     # Visual Confirmation
     session.visualize()
     
-    # 3. Telemetry Setup
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Files", "center", "magenta", 12),
-        ("L1 Toks", "center", "white", 10),
-        ("Arts", "center", "green", 4),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Thought Process", "left", "italic dim", 50),
-        ("Auditor", "center", None, 8)
-    ]
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
-
     # --- PHASE 1: Ingest Bug ---
     console.print(Rule("Phase 1: Ingesting Bug"))
     
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    console.print(header)
-    console.print(Rule(style="dim"))
+    # Header and rule-separated rows share one Table, redrawn in place by Live
+    trace_table = make_trace_table()
 
     turn_count = 0
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
+    with live_trace(trace_table):
+        for event in session.app.stream(session.state, config=config):
+            node_name = next(iter(event))
+            node_output = event[node_name]
         
-        current_state = session.app.get_state(config).values
-        if not current_state: current_state = session.state
+            current_state = session.app.get_state(config).values
+            if not current_state: current_state = session.state
             
-        fw_state = current_state.get('framework_state')
-        pager = session.pager
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+            fw_state = current_state.get('framework_state')
+            pager = session.pager
+            move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+            audit = current_state.get('last_audit')
 
-        if node_name == "manager":
-            turn_count += 1
+            if node_name == "manager":
+                turn_count += 1
         
-        if move:
-            active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
-            artifact_names = [a.identifier for a in fw_state.artifacts]
-            token_str = f"{pager.current_usage}/{pager.capacity}"
-            audit_val = audit["auditor_verdict"] if audit else "---"
-            audit_style = "green" if audit_val == "PASS" else "red" if audit_val == "REJECT" else "white"
-            node_label = "Manager 🧠" if node_name == "manager" else "Auditor 🛡️" if node_name == "auditor" else "Executor ⚡"
-
-            row_data = (
-                str(turn_count),
-                ", ".join(active_files) if active_files else "EMPTY",
-                token_str,
-                str(len(artifact_names)),
-                node_label,
-                f"{move.tool_call}({move.target})" if move else "---",
-                move.thought_process if move else "---",
-                Text(audit_val, style=audit_style)
-            )
-            print_stream_row(row_data)
-
-        if fw_state.artifacts: break 
+            if move:
+                tool_call, target = move.tool_call, move.target
+                active_files = pager.file_pages
+                artifact_names = [a.identifier for a in fw_state.artifacts]
+                token_str = f"{pager.current_usage}/{pager.capacity}"
+                audit_val = audit["auditor_verdict"] if audit else "---"
+                node_label = NODE_LABELS.get(node_name, node_name)
+
+                row_data = (
+                    str(turn_count),
+                    ", ".join(active_files) if active_files else "EMPTY",
+                    token_str,
+                    str(len(artifact_names)),
+                    node_label,
+                    f"{tool_call}({target})",
+                    move.thought_process,
+                    audit_cell(audit_val)
+                )
+                trace_table.add_row(*row_data)
+
+            if fw_state.artifacts: break 
     
     # SNAPSHOT
     snapshot_id = session.snapshot_state(label="buggy_state")
@@ -130,7 +106,7 @@ def run_time_travel_proof():
         console.print(Panel("[bold red]FAIL: Agent hallucinated the fix into the past.[/bold red]"))
 
     # Cleanup
-    if os.path.exists("calc.py"): os.remove("calc.py")
+    Path("calc.py").unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_time_travel_proof()
\ No newline at end of file
@@ -1,19 +1,26 @@
 import os
 import sys
 import shutil
-from rich.console import Console
-from rich.table import Table
 from rich.panel import Panel
-from rich.text import Text
-from rich.rule import Rule
 
 # Ensure framework access
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 from amnesic.core.session import AmnesicSession
 from amnesic.core.sidecar import SharedSidecar
+from tests.common.telemetry import CONSOLE, audit_cell, live_trace, make_trace_table
+
+# Trace columns: (name, justify, style, width)
+COLS = (
+    ("Turn", "right", "cyan", 4),
+    ("L1 Contents", "center", "magenta", 20),
+    ("Node", "left", "blue", 10),
+    ("Manager Action", "left", "yellow", 25),
+    ("Cross-Repo Logic", "left", "italic dim", 45),
+    ("Auditor", "center", None, 8),
+)
 
 def run_nexus_proof():
-    console = Console()
+    console = CONSOLE
     
     # Reset Sidecar for a clean start
     SharedSidecar().reset()
@@ -67,75 +74,58 @@ def run_nexus_proof():
     turn_count = 0
     
     # 3. Telemetry
-    COLS = [
-        ("Turn", "right", "cyan", 4),
-        ("L1 Contents", "center", "magenta", 20),
-        ("Node", "left", "blue", 10),
-        ("Manager Action", "left", "yellow", 25),
-        ("Cross-Repo Logic", "left", "italic dim", 45),
-        ("Auditor", "center", None, 8)
-    ]
-
-    header = Table(show_lines=False, box=None, padding=(0, 1), expand=False)
-    for name, just, style, w in COLS:
-        header.add_column(name, justify=just, style="bold " + (style or ""), width=w)
-    
+    # Header and rule-separated rows share one Table, redrawn in place by Live
     console.print(Panel("Nexus Mission Trace", style="bold blue"))
-    console.print(header)
-    console.print(Rule(style="dim"))
-
-    def print_stream_row(row_data):
-        row_table = Table(show_header=False, show_lines=False, box=None, padding=(0, 1), expand=False)
-        for name, just, style, w in COLS:
-            row_table.add_column(justify=just, style=style, width=w)
-        row_table.add_row(*row_data)
-        console.print(row_table)
-        console.print(Rule(style="dim"))
+    trace_table = make_trace_table(cols=COLS)
+    outcome = None
 
     # 4. Execution Loop
-    for event in session.app.stream(session.state, config=config):
-        node_name = list(event.keys())[0]
-        node_output = event[node_name]
-        current_state = session.app.get_state(config).values
+    with live_trace(trace_table):
+        for event in session.app.stream(session.state, config=config):
+            node_name = next(iter(event))
+            node_output = event[node_name]
+            current_state = session.app.get_state(config).values
         
-        if node_name == "manager":
-            turn_count += 1
+            if node_name == "manager":
+                turn_count += 1
         
-        pager = session.pager
-        move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
-        audit = current_state.get('last_audit')
+            pager = session.pager
+            move = node_output.get('manager_decision') if 'manager_decision' in node_output else current_state.get('manager_decision')
+            audit = current_state.get('last_audit')
         
-        active_files = [k.replace("FILE:", "") for k in pager.active_pages.keys() if "SYS:" not in k]
+            active_files = pager.file_pages
         
-        audit_val = audit["auditor_verdict"] if audit else "---"
-        audit_style = "green" if "PASS" in str(audit_val) else "red" if "REJECT" in str(audit_val) else "white"
+            audit_val = audit["auditor_verdict"] if audit else "---"
 
-        if move:
-            row_data = (
-                str(turn_count),
-                ", ".join(active_files) if active_files else "EMPTY",
-                node_name,
-                f"{move.tool_call}({move.target})",
-                move.thought_process,
-                Text(str(audit_val), style=audit_style)
-            )
-            print_stream_row(row_data)
+            if move:
+                row_data = (
+                    str(turn_count),
+                    ", ".join(active_files) if active_files else "EMPTY",
+                    node_name,
+                    f"{move.tool_call}({move.target})",
+                    move.thought_process,
+                    audit_cell(str(audit_val))
+                )
+                trace_table.add_row(*row_data)
 
-            # Check for actual fix on disk
-            service_path = os.path.join(repo_app, "service.py")
-            if os.path.exists(service_path):
-                with open(service_path) as f:
-                    content = f.read()
-                    if "process_payment(total, 'USD')" in content or "process_payment(total)" in content:
-                        console.print(Panel("[bold green]SUCCESS: Cross-repo bug fixed on disk.[/bold green]"))
-                        break
+                # Check for actual fix on disk
+                service_path = os.path.join(repo_app, "service.py")
+                if os.path.exists(service_path):
+                    with open(service_path) as f:
+                        content = f.read()
+                        if "process_payment(total, 'USD')" in content or "process_payment(total)" in content:
+                            outcome = Panel("[bold green]SUCCESS: Cross-repo bug fixed on disk.[/bold green]")
+                            break
             
-            if move.tool_call == "halt_and_ask":
-                break
+                if move.is_halt:
+                    break
         
-        if turn_count > 25:
-            console.print("[bold red]Timeout.[/bold red]")
-            break
+            if turn_count > 25:
+                outcome = "[bold red]Timeout.[/bold red]"
+                break
+
+    if outcome:
+        console.print(outcome)
 
     # Cleanup
     for d in [repo_lib, repo_app]:
@@ -1,19 +1,18 @@
 import os
 import sys
 import random
-import time
-from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
 from rich.panel import Panel
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")))
 
 from amnesic.core.dynamic_pager import DynamicPager
 from amnesic.tools.vector_store import VectorStore
+from tests.common.telemetry import CONSOLE
 import logging
 
-console = Console()
+console = CONSOLE
 # Suppress Pager logs for clean output
 logging.basicConfig(level=logging.CRITICAL)
 
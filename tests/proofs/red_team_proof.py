@@ -4,16 +4,17 @@ Verifies that the Auditor prevents an agent from violating physical invariants
 (e.g., trying to stage multiple files in Strict Amnesia mode).
 """
 import sys
+from pathlib import Path
 import os
-from rich.console import Console
 from rich.panel import Panel
 
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+if __name__ == "__main__": sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from amnesic.core.session import AmnesicSession
 from amnesic.decision.manager import ManagerMove
+from tests.common.telemetry import CONSOLE
 
 def run_red_team_proof():
-    console = Console()
+    console = CONSOLE
     
     # 1. Setup
     with open("hostile_a.txt", "w") as f: f.write("Data A")
@@ -69,7 +70,7 @@ def run_red_team_proof():
 
     # Cleanup
     for f in ["hostile_a.txt", "hostile_b.txt"]:
-        if os.path.exists(f): os.remove(f)
+        Path(f).unlink(missing_ok=True)
 
 if __name__ == "__main__":
     run_red_team_proof()
@@ -37,6 +37,21 @@ class TestAmnesicTricks(unittest.TestCase):
         self.assertIn("def target_method", active_content)
         self.assertNotIn("small_func", active_content)
 
+    def test_contextual_grepping_json(self):
+        """Verify that ?query on a JSON file loads only the addressed value."""
+        with open(os.path.join(self.test_dir, "config.json"), "w") as f:
+            f.write('{"version": "v2.4.1", "db": {"host": "10.0.0.5"}, "noise": "' + "x" * 2000 + '"}')
+        session = AmnesicSession(mission="Grep test", root_dir=self.test_dir)
+
+        session._tool_stage("config.json?query=db.host")
+        active_content = session.pager.render_context()
+        self.assertIn('"db.host": "10.0.0.5"', active_content)
+        self.assertNotIn("xxxx", active_content)
+        self.assertIn("FILE:config.json[db.host]", session.pager.active_pages)
+
+        session._tool_stage("config.json?query=missing")
+        self.assertIn("not found", session.state['framework_state'].last_action_feedback)
+
     def test_semantic_pinning(self):
         """Verify that PINNED_L1 artifacts survive context wipes."""
         session = AmnesicSession(mission="Pin test", root_dir=self.test_dir)
@@ -1,5 +1,7 @@
+import copy
 import unittest
-from amnesic.core.dynamic_pager import DynamicPager, DynamicPage
+from amnesic.core import dynamic_pager
+from amnesic.core.dynamic_pager import DynamicPager, DynamicPage, count_tokens
 
 class TestDynamicPager(unittest.TestCase):
     def setUp(self):
@@ -59,6 +61,70 @@ class TestDynamicPager(unittest.TestCase):
         self.assertIn("page1", self.pager.active_pages)
         self.assertIn("page3", self.pager.active_pages)
 
+    def test_version_tracks_membership(self):
+        v0 = self.pager.version
+        self.pager.request_access("page1", "content")
+        v1 = self.pager.version
+        self.assertNotEqual(v0, v1)
+
+        # Refreshing an L1 page leaves the page set (and version) unchanged
+        self.pager.request_access("page1", "new content")
+        self.assertEqual(self.pager.version, v1)
+
+        # Direct mutation through active_pages is tracked too
+        del self.pager.active_pages["page1"]
+        self.assertNotEqual(self.pager.version, v1)
+
+    def test_file_pages_strips_prefix(self):
+        self.pager.pin_page("SYS:MISSION", "mission")
+        self.pager.request_access("FILE:a.py", "content")
+        self.assertEqual(self.pager.file_pages, ("a.py",))
+
+        # Cached view follows membership changes
+        self.pager.evict_to_l2("FILE:a.py")
+        self.assertEqual(self.pager.file_pages, ())
+
+    def test_count_tokens_memoized(self):
+        text = "def f():\n    return 42\n" * 20
+        first = count_tokens(text)
+        size = len(dynamic_pager._token_cache)
+        self.assertEqual(count_tokens(text), first)
+        self.assertEqual(len(dynamic_pager._token_cache), size)
+        self.assertEqual(count_tokens("   "), 0)
+
+    def test_make_space_evicts_lowest_scores_first(self):
+        content = "word " * 30
+        size = count_tokens(content)
+        pager = DynamicPager(capacity_tokens=size * 3)
+        pager.request_access("keep", content, priority=9)
+        pager.request_access("old", content, priority=1)
+        pager.request_access("mid", content, priority=5)
+
+        # Room for one more page: only the lowest-scoring page goes
+        pager.request_access("new", content)
+        self.assertEqual(list(pager.active_pages), ["keep", "mid", "new"])
+        self.assertIn("old", pager.swap_disk)
+        self.assertEqual(pager.current_usage, size * 3)
+
+    def test_current_usage_tracks_page_set(self):
+        pager = DynamicPager(capacity_tokens=1000)
+        pager.request_access("a", "alpha " * 20)
+        pager.request_access("b", "beta " * 10)
+        self.assertEqual(pager.current_usage, sum(p.tokens for p in pager.active_pages.values()))
+
+        # Refreshing content re-sizes the page in place
+        pager.request_access("a", "alpha")
+        self.assertEqual(pager.current_usage, pager.active_pages["a"].tokens + pager.active_pages["b"].tokens)
+
+        # Snapshots round-trip without double counting, and direct removal is tracked
+        snapshot = copy.deepcopy(pager.active_pages)
+        del pager.active_pages["b"]
+        self.assertEqual(pager.current_usage, pager.active_pages["a"].tokens)
+        pager.active_pages.clear()
+        pager.active_pages.update(snapshot)
+        self.assertEqual(snapshot.usage, pager.current_usage)
+        self.assertEqual(pager.current_usage, sum(p.tokens for p in pager.active_pages.values()))
+
     def test_current_turn_increment(self):
         self.assertEqual(self.pager.current_turn, 0)
         self.pager.tick()